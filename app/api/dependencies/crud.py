@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.dependencies.database import get_db_session
+from db.crud.membership import MembershipCrud
+from db.crud.message import MessageCrud
+from db.crud.user import UsersCrud
+
+
+def get_membership_crud(db: AsyncSession = Depends(get_db_session)) -> MembershipCrud:
+    return MembershipCrud(db)
+
+
+def get_users_crud(db: AsyncSession = Depends(get_db_session)) -> UsersCrud:
+    return UsersCrud(db)
+
+
+def get_message_crud(db: AsyncSession = Depends(get_db_session)) -> MessageCrud:
+    return MessageCrud(db)
+
+
+# Use these in your endpoints
+MembershipCrudDep = Annotated[MembershipCrud, Depends(get_membership_crud)]
+UsersCrudDep = Annotated[UsersCrud, Depends(get_users_crud)]
+MessageCrudDep = Annotated[MessageCrud, Depends(get_message_crud)]
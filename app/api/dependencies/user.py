@@ -1,3 +1,6 @@
+import time
+
+import orjson
 from fastapi import Depends, HTTPException
 from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,11 +11,26 @@ from api.dependencies.database import get_db_session
 from core.config import settings
 from db.crud.user import UsersCrud
 from schemas.user import OutUserSchema
+from utils.redis_manager import RedisManager
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 SECRET_KEY = settings.JWT_SECRET_KEY
 ALGORITHM = settings.JWT_ALGORITHM
 
+# Resolving the JWT subject costs a DB round-trip on every authenticated
+# request; cache the validated user briefly so the hot path is a Redis GET.
+# Write paths that change a user call invalidate_user_cache
+_USER_CACHE_TTL_CAP = 300  # seconds; never beyond the token's own expiry
+
+
+def _user_cache_key(email: str) -> str:
+    return f"auth:user:{email}"
+
+
+async def invalidate_user_cache(email: str) -> None:
+    """Drop the cached auth user after a role/approval/profile change."""
+    await RedisManager.delete(_user_cache_key(email))
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -31,11 +49,27 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
+    cached = await RedisManager.get(_user_cache_key(email))
+    if cached is not None:
+        return OutUserSchema.model_validate(cached)
+
     user_crud = UsersCrud(db)
     user = await user_crud.get_by_email(email=email)
     if user is None:
         raise credentials_exception
-    return OutUserSchema.model_validate(user)
+
+    schema = OutUserSchema.model_validate(user)
+    ttl = _USER_CACHE_TTL_CAP
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        ttl = min(ttl, int(expires_at - time.time()))
+    if ttl > 0:
+        await RedisManager.set(
+            _user_cache_key(email),
+            orjson.loads(schema.model_dump_json()),
+            ex=ttl,
+        )
+    return schema
 
 
 async def get_current_active_user(current_user: OutUserSchema = Depends(get_current_user)) -> OutUserSchema:
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.database import get_db_session
 from api.dependencies.pagination import PaginationDep
-from api.dependencies.user import get_current_active_user
+from api.dependencies.user import get_current_active_user, invalidate_user_cache
 from db.crud.user import UsersCrud
 from db.crud.placement import PlacementCrud
 from db.crud.membership import MembershipCrud
@@ -68,6 +68,7 @@ async def approve_team(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found or could not be approved"
         )
+    await invalidate_user_cache(approved_team.email)
 
     return OutUserSchema.model_validate(approved_team)
 
@@ -127,8 +128,15 @@ async def update_user(
             detail="User not found"
         )
 
+    # Capture the email before the update: the auth cache is keyed by it,
+    # and JWTs issued earlier still resolve through the old address
+    previous_email = user.email
+
     updated_user = await user_crud.update_by_id(user_id, user_data)
     await user_crud.commit_session()
+    await invalidate_user_cache(previous_email)
+    if updated_user.email != previous_email:
+        await invalidate_user_cache(updated_user.email)
 
     return OutUserSchema.model_validate(updated_user)
 
@@ -156,6 +164,7 @@ async def activate_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found or could not be activated"
         )
+    await invalidate_user_cache(activated_user.email)
 
     return OutUserSchema.model_validate(activated_user)
 
@@ -183,6 +192,7 @@ async def deactivate_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found or could not be deactivated"
         )
+    await invalidate_user_cache(deactivated_user.email)
 
     return OutUserSchema.model_validate(deactivated_user)
 
@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.database import get_db_session
@@ -60,34 +60,33 @@ async def apply_to_vacancy(
             detail="Vacancy not found"
         )
     
-    # Check if candidate already applied
-    existing_application = await application_crud.check_existing_application(
-        current_user.id, application_data.vacancy_id
-    )
-    if existing_application:
+    # Create application; the unique (candidate_id, vacancy_id) index
+    # rejects duplicates in the same statement
+    application_dict = application_data.model_dump()
+    application_dict["candidate_id"] = current_user.id
+
+    application = await application_crud.create_application(application_dict)
+    if application is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already applied to this vacancy"
         )
-    
-    # Create application
-    application_dict = application_data.model_dump()
-    application_dict["candidate_id"] = current_user.id
-    
-    application = await application_crud.create(application_dict)
-    await application_crud.commit_session()
-    
-    return OutApplicationSchema.model_validate(application)
+
+    return application
 
 
 @router.get("/my-applications", response_model=List[OutApplicationSchema])
 async def get_my_applications(
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_candidate_role)
+    current_user: OutUserSchema = Depends(require_candidate_role),
+    limit: int = Query(100, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all applications for the current candidate."""
+    """Get a page of applications for the current candidate."""
     application_crud = ApplicationCrud(db)
-    applications = await application_crud.get_applications_by_candidate_id(current_user.id)
+    applications = await application_crud.get_applications_by_candidate_id(
+        current_user.id, limit=limit, offset=offset
+    )
     
     return [OutApplicationSchema.model_validate(app) for app in applications]
 
@@ -95,11 +94,15 @@ async def get_my_applications(
 @router.get("/pending", response_model=List[OutApplicationSchema])
 async def get_pending_applications(
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_team_role)
+    current_user: OutUserSchema = Depends(require_team_role),
+    limit: int = Query(100, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all pending applications for the current team's vacancies."""
+    """Get a page of pending applications for the current team's vacancies."""
     application_crud = ApplicationCrud(db)
-    applications = await application_crud.get_pending_applications_by_team(current_user.id)
+    applications = await application_crud.get_pending_applications_by_team(
+        current_user.id, limit=limit, offset=offset
+    )
     
     return [OutApplicationSchema.model_validate(app) for app in applications]
 
@@ -108,7 +111,9 @@ async def get_pending_applications(
 async def get_applications_for_vacancy(
     vacancy_id: int,
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_team_role)
+    current_user: OutUserSchema = Depends(require_team_role),
+    limit: int = Query(100, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
     """Get all applications for a specific vacancy."""
     application_crud = ApplicationCrud(db)
@@ -128,7 +133,9 @@ async def get_applications_for_vacancy(
             detail="You can only view applications for your own vacancies"
         )
     
-    applications = await application_crud.get_applications_by_vacancy_id(vacancy_id)
+    applications = await application_crud.get_applications_by_vacancy_id(
+        vacancy_id, limit=limit, offset=offset
+    )
     
     return [OutApplicationSchema.model_validate(app) for app in applications]
 
@@ -9,11 +9,11 @@ from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File
 from fastapi.security import OAuth2PasswordRequestForm
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.database import get_db_session, DbSessionDep
-from api.dependencies.user import get_current_active_user, get_current_user
+from api.dependencies.user import get_current_active_user, get_current_user, invalidate_user_cache
 from api.v1.application import require_team_role
 from api.v1.membership import MEMBERSHIP_PRICES
 from db.crud.membership import MembershipCrud
@@ -264,6 +264,7 @@ async def update_user_profile(
     await users_crud.update_by_id(current_user.id, profile_data)
     await users_crud.commit_session()
     result = await users_crud.get_by_id(current_user.id)
+    await invalidate_user_cache(current_user.email)
     return result
 
 
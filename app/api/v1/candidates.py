@@ -1,17 +1,18 @@
+import logging
 from io import BytesIO
 from typing import List, Optional
 import os
 import uuid
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query, UploadFile, File
-from fastapi.responses import FileResponse
+from aiofiles import os as aio_os
+from fastapi import APIRouter, HTTPException, Depends, status, Query, UploadFile, File, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.database import get_db_session
 from api.dependencies.pagination import PaginationDep
+from api.dependencies.rate_limiter.depends import RateLimiter
 from api.dependencies.user import get_current_active_user
-from db.crud.membership import MembershipCrud
 from db.crud.user import UsersCrud
 from db.tables.user import UserRole
 from schemas.user import (
@@ -23,6 +24,8 @@ from schemas.user import (
 from core.config import settings
 from utils.s3 import upload_cv_to_s3, generate_presigned_url, delete_file_from_s3
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/candidates",
     tags=["Candidates"],
@@ -47,6 +50,8 @@ def require_team_role(current_user: OutUserSchema = Depends(get_current_active_u
 @router.get("", response_model=PaginatedUserSchema)
 async def search_candidates(
     pagination: PaginationDep,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
     current_user: OutUserSchema = Depends(require_team_role),
     role: Optional[str] = Query(None, description="Filter by role/position"),
@@ -57,13 +62,25 @@ async def search_candidates(
     """Search and browse candidates."""
     user_crud = UsersCrud(db)
 
-    search_params = CandidateSearchSchema(
+    # Query params were already validated by FastAPI above, so the
+    # carrier schema can skip a second pydantic pass
+    search_params = CandidateSearchSchema.model_construct(
         role=role,
         location=location,
         experience_level=experience_level,
         position=position
     )
 
+    # Cheap MAX(updated_at) over the filtered set gives a stable ETag so
+    # polling clients can be answered with 304 instead of a full page
+    latest_mtime = await user_crud.latest_candidate_mtime(search_params)
+    if latest_mtime:
+        etag = f'W/"{int(latest_mtime.timestamp())}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, max-age=30"
+
     candidates = await user_crud.search_candidates(
         search_params,
         limit=pagination.limit,
@@ -103,25 +120,13 @@ async def get_candidate_profile(
     """Get detailed candidate profile."""
     user_crud = UsersCrud(db)
 
-    candidate = await user_crud.get_by_id(candidate_id)
+    candidate = await user_crud.get_active_candidate_by_id(candidate_id)
     if not candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Candidate not found"
         )
 
-    if candidate.role != UserRole.CANDIDATE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User is not a candidate"
-        )
-
-    if not candidate.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Candidate profile is not active"
-        )
-
     return OutUserSchema.model_validate(candidate)
 
 
@@ -134,19 +139,13 @@ async def get_candidate_cv(
     """Get candidate CV file (if uploaded)."""
     user_crud = UsersCrud(db)
 
-    candidate = await user_crud.get_by_id(candidate_id)
+    candidate = await user_crud.get_active_candidate_by_id(candidate_id)
     if not candidate:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Candidate not found"
         )
 
-    if candidate.role != UserRole.CANDIDATE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User is not a candidate"
-        )
-
     if not candidate.cv_file_path:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -202,18 +201,23 @@ def require_candidate_role(current_user: OutUserSchema = Depends(get_current_act
     return current_user
 
 
-@router.post("/upload-cv")
+@router.post("/upload-cv", dependencies=[Depends(RateLimiter(times=3, minutes=1))])
 async def upload_cv(
     db: AsyncSession = Depends(get_db_session),
     current_user: OutUserSchema = Depends(require_candidate_role),
     file: UploadFile = File(...)
 ):
     user_crud = UsersCrud(db)
-    membership_crud = MembershipCrud(db)
 
-    # Check if user has active membership
-    active_membership = await membership_crud.get_active_membership_by_user_id(current_user.id)
-    if not active_membership:
+    # Fetch the user and the active-membership flag in one round-trip
+    user, has_active_membership = await user_crud.get_with_active_membership(current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    if not has_active_membership:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Active membership required to upload CV. Please purchase a membership first."
@@ -236,18 +240,23 @@ async def upload_cv(
     # Read file into memory
     content = await file.read()
 
-    if len(content) > settings.MAX_FILE_SIZE:
+    # Check magic bytes (PDF, DOCX/ZIP, legacy DOC OLE header) so a spoofed
+    # extension is rejected before anything is written to storage
+    header = content[:8]
+    if not (
+        header.startswith(b'%PDF-')
+        or header.startswith(b'PK\x03\x04')
+        or header.startswith(b'\xD0\xCF\x11\xE0')
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File size exceeds limit of {settings.MAX_FILE_SIZE // (1024 * 1024)}MB"
+            detail="File content does not match an allowed document type"
         )
 
-    # Get actual user model from DB
-    user = await user_crud.get_model_by_id(current_user.id)
-    if not user:
+    if len(content) > settings.MAX_FILE_SIZE:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size exceeds limit of {settings.MAX_FILE_SIZE // (1024 * 1024)}MB"
         )
 
     # Delete previous CV if exists
@@ -255,7 +264,7 @@ async def upload_cv(
         try:
             delete_file_from_s3(user.cv_file_path)
         except Exception as e:
-            print(f"Warning: Failed to delete old CV from S3: {e}")
+            logger.warning(f"Failed to delete old CV from S3: {e}")
 
     # Upload new CV and update user in a transaction
     try:
@@ -267,7 +276,7 @@ async def upload_cv(
         user.cv_file_path = s3_key
         await user_crud.commit_session()  # Use the CRUD's commit method
     except Exception as e:
-        print(f"Error uploading to S3 or updating DB: {e}")
+        logger.error(f"Error uploading to S3 or updating DB: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error processing file"
@@ -288,11 +297,17 @@ async def upload_cv(
 async def download_cv(
     user_id: int,
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_candidate_role)
+    current_user: OutUserSchema = Depends(get_current_active_user)
 ):
     """Generate a presigned URL to download the CV from S3."""
     from utils.s3 import generate_presigned_url
 
+    # Candidates can fetch their own CV; approved teams can fetch any
+    is_owner = current_user.id == user_id
+    is_approved_team = current_user.role == UserRole.TEAM and current_user.is_approved
+    if not (is_owner or is_approved_team):
+        raise HTTPException(status_code=403, detail="You can only download your own CV")
+
     user_crud = UsersCrud(db)
 
     # Get user
@@ -300,10 +315,6 @@ async def download_cv(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Only allow user to access their own CV
-    if current_user.id != user_id:
-        raise HTTPException(status_code=403, detail="You can only download your own CV")
-
     # Check CV exists
     if not user.cv_file_path:
         raise HTTPException(status_code=404, detail="CV file not found")
@@ -311,7 +322,7 @@ async def download_cv(
     try:
         presigned_url = generate_presigned_url(user.cv_file_path)
     except Exception as e:
-        print(f"Failed to generate S3 download link: {e}")
+        logger.error(f"Failed to generate S3 download link: {e}")
         raise HTTPException(status_code=500, detail="Failed to generate download URL")
 
     return {
@@ -330,30 +341,20 @@ async def delete_cv(
 
     user_crud = UsersCrud(db)
 
-    # Get user
-    user = await user_crud.get_model_by_id(current_user.id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Check if CV exists
-    if not user.cv_file_path:
+    # Clear the path and read back the old one in a single UPDATE ... RETURNING
+    old_cv_path = await user_crud.clear_cv_path(current_user.id)
+    if not old_cv_path:
         raise HTTPException(status_code=404, detail="No CV file found")
 
-    # Attempt to delete from S3
+    # Attempt to delete from S3; the uncommitted UPDATE is rolled back on failure
     try:
-        delete_file_from_s3(user.cv_file_path)
-        print(f"Deleted CV from S3: {user.cv_file_path}")
+        delete_file_from_s3(old_cv_path)
+        logger.info(f"Deleted CV from S3: {old_cv_path}")
     except Exception as e:
-        print(f"Error deleting from S3: {e}")
+        logger.error(f"Error deleting from S3: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete CV from storage")
 
-    # Clear path from DB
-    try:
-        user.cv_file_path = None
-        await user_crud.commit_session()
-        print(f"Removed CV path from DB for user {current_user.id}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="Failed to update user profile")
+    await user_crud.commit_session()
 
     return {"message": "CV file deleted successfully"}
 
@@ -375,68 +376,37 @@ async def get_cv_info(
         )
 
     # Check if user has CV file
-    if not user.cv_file_path or not os.path.exists(user.cv_file_path):
+    if not user.cv_file_path:
         return {
             "has_cv": False,
             "message": "No CV file found"
         }
 
-    # Get file info
+    # A single stat covers existence, size and mtime in one syscall
     try:
-        file_stat = os.stat(user.cv_file_path)
-        filename = os.path.basename(user.cv_file_path)
-        file_extension = os.path.splitext(filename)[1]
-
+        file_stat = await aio_os.stat(user.cv_file_path)
+    except FileNotFoundError:
         return {
-            "has_cv": True,
-            "filename": filename,
-            "file_size": file_stat.st_size,
-            "file_extension": file_extension,
-            "upload_date": file_stat.st_mtime,
-            "download_url": f"/api/v1/candidates/download-cv/{current_user.id}"
+            "has_cv": False,
+            "message": "No CV file found"
         }
     except Exception as e:
-        print(f"Error getting CV file info: {e}")
+        logger.error(f"Error getting CV file info: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error retrieving CV file information"
         )
 
+    filename = user.cv_file_path.rsplit("/", 1)[-1]
 
-@router.get("/download-cv/{candidate_id}")
-async def download_cv(
-    candidate_id: int,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_team_role)
-):
-    """Download a candidate's CV file."""
-    user_crud = UsersCrud(db)
-
-    candidate = await user_crud.get_by_id(candidate_id)
-    if not candidate:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Candidate not found"
-        )
-
-    if candidate.role != UserRole.CANDIDATE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User is not a candidate"
-        )
-
-    if not candidate.cv_file_path or not os.path.exists(candidate.cv_file_path):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="CV file not found"
-        )
-
-    filename = os.path.basename(candidate.cv_file_path)
-    return FileResponse(
-        path=candidate.cv_file_path,
-        filename=f"{candidate.first_name}_{candidate.last_name}_CV.pdf",
-        media_type="application/octet-stream"
-    )
+    return {
+        "has_cv": True,
+        "filename": filename,
+        "file_size": file_stat.st_size,
+        "file_extension": os.path.splitext(filename)[1],
+        "upload_date": file_stat.st_mtime,
+        "download_url": f"/api/v1/candidates/download-cv/{current_user.id}"
+    }
 
 
 @router.get("/my-cv")
@@ -454,10 +424,16 @@ async def get_my_cv(
             detail="CV file not found"
         )
 
+    # A single stat replaces the exists + getsize pair
+    try:
+        file_size = (await aio_os.stat(user.cv_file_path)).st_size
+    except FileNotFoundError:
+        file_size = 0
+
     return {
         "cv_uploaded": True,
-        "filename": os.path.basename(user.cv_file_path),
-        "file_size": os.path.getsize(user.cv_file_path) if os.path.exists(user.cv_file_path) else 0,
+        "filename": user.cv_file_path.rsplit("/", 1)[-1],
+        "file_size": file_size,
         "download_url": f"/api/v1/candidates/download-cv/{current_user.id}"
     }
 
@@ -470,22 +446,21 @@ async def delete_my_cv(
     """Delete current candidate's CV file."""
     user_crud = UsersCrud(db)
 
-    user = await user_crud.get_by_id(current_user.id)
-    if not user or not user.cv_file_path:
+    # Clear the path and read back the old one in a single UPDATE ... RETURNING
+    old_cv_path = await user_crud.clear_cv_path(current_user.id)
+    if not old_cv_path:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="CV file not found"
         )
 
     # Remove the file from storage
-    if os.path.exists(user.cv_file_path):
+    if await aio_os.path.exists(old_cv_path):
         try:
-            os.remove(user.cv_file_path)
+            await aio_os.remove(old_cv_path)
         except OSError:
             pass  # Ignore errors if file doesn't exist
 
-    # Clear the file path from database
-    user.cv_file_path = None
     await user_crud.commit_session()
 
     return {
@@ -1,16 +1,25 @@
+import asyncio
+import hashlib
+import hmac
+import logging
+import time
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
+import orjson
 import stripe
-from asyncer import asyncify
-from fastapi import APIRouter, HTTPException, Depends, status, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Query, status, Request, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.dependencies.crud import get_membership_crud, get_users_crud
 from api.dependencies.database import get_db_session
+from api.dependencies.rate_limiter.depends import RateLimiter
 from api.dependencies.user import get_current_active_user
 from db.crud.membership import MembershipCrud
 from db.crud.user import UsersCrud
+from db.session import async_session
 from db.tables.user import UserRole
 from db.tables.membership import MembershipPlan, MembershipStatus
 from schemas.membership import (
@@ -20,7 +29,10 @@ from schemas.membership import (
 )
 from schemas.user import OutUserSchema
 from core.config import settings
-from utils.stripe_utils import create_stripe_checkout_session, get_checkout_items
+from utils.redis_manager import RedisManager
+from utils.stripe_utils import create_stripe_checkout_session, get_checkout_items, stripe_call
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/memberships",
@@ -28,14 +40,31 @@ router = APIRouter(
 )
 
 # Stripe configuration
-stripe.api_key = settings.STRIPE_SECRET_KEY
-
-# Membership pricing
-MEMBERSHIP_PRICES = {
-    MembershipPlan.BASIC: 0.00,  # Free plan
-    MembershipPlan.PREMIUM: 4.99,
-    MembershipPlan.PROFESSIONAL: 9.99
+stripe.api_key = settings.stripe.STRIPE_SECRET_KEY
+
+# Membership pricing in integer cents — the canonical representation, and
+# what Stripe expects — with a derived dollar mapping for display/DB use
+MEMBERSHIP_PRICES_CENTS = {
+    MembershipPlan.BASIC: 0,  # Free plan
+    MembershipPlan.PREMIUM: 499,
+    MembershipPlan.PROFESSIONAL: 999
 }
+MEMBERSHIP_PRICES = {plan: cents / 100 for plan, cents in MEMBERSHIP_PRICES_CENTS.items()}
+
+# Plan tier ordering, precomputed so upgrade checks are O(1) dict lookups
+_PLAN_RANK: dict[MembershipPlan, int] = {p: i for i, p in enumerate(MembershipPlan)}
+
+# 30-day subscription window, hoisted off the payment hot path
+_MEMBERSHIP_DURATION = timedelta(days=30)
+
+
+def _utcnow() -> datetime:
+    """Current UTC time, naive to match the DB's timestamp columns.
+
+    datetime.utcnow() is deprecated in 3.12; the columns are naive
+    DateTime, so strip the tzinfo rather than store aware values.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class CreatePaymentIntentSchema(BaseModel):
@@ -47,6 +76,43 @@ class PaymentConfirmationSchema(BaseModel):
     plan_type: MembershipPlan
 
 
+# Active memberships change on the order of days but are checked on every
+# purchase/read path, so a short Redis cache absorbs the repeat DB lookups
+_ACTIVE_MEMBERSHIP_TTL = 60  # seconds
+_NO_MEMBERSHIP_SENTINEL = "none"
+
+
+def _active_membership_key(user_id: int) -> str:
+    return f"memb:active:{user_id}"
+
+
+async def get_cached_active_membership(
+    membership_crud: MembershipCrud,
+    user_id: int
+) -> Optional[OutMembershipSchema]:
+    """Get a user's active membership through the short-TTL Redis cache."""
+    key = _active_membership_key(user_id)
+    cached = await RedisManager.get(key)
+    if cached == _NO_MEMBERSHIP_SENTINEL:
+        return None
+    if cached is not None:
+        return OutMembershipSchema.model_validate(cached)
+
+    membership = await membership_crud.get_active_membership_by_user_id(user_id)
+    if membership is None:
+        await RedisManager.set(key, _NO_MEMBERSHIP_SENTINEL, ex=_ACTIVE_MEMBERSHIP_TTL)
+        return None
+
+    schema = OutMembershipSchema.model_validate(membership)
+    await RedisManager.set(key, orjson.loads(schema.model_dump_json()), ex=_ACTIVE_MEMBERSHIP_TTL)
+    return schema
+
+
+async def invalidate_active_membership_cache(user_id: int) -> None:
+    """Drop the cached membership after anything that changes it."""
+    await RedisManager.delete(_active_membership_key(user_id))
+
+
 def require_candidate_role(current_user: OutUserSchema = Depends(get_current_active_user)) -> OutUserSchema:
     """Require user to be a candidate."""
     if current_user.role != UserRole.CANDIDATE:
@@ -70,11 +136,10 @@ def require_candidate_role(current_user: OutUserSchema = Depends(get_current_act
 async def create_checkout_session(
     payment_data: CreatePaymentIntentSchema,
     current_user: OutUserSchema = Depends(require_candidate_role),
-    db_session: AsyncSession = Depends(get_db_session),
+    membership_crud: MembershipCrud = Depends(get_membership_crud),
 ):
     try:
-        membership_crud = MembershipCrud(db_session)
-        active_membership = await membership_crud.get_active_membership_by_user_id(current_user.id)
+        active_membership = await get_cached_active_membership(membership_crud, current_user.id)
 
         if active_membership:
             raise HTTPException(
@@ -82,14 +147,14 @@ async def create_checkout_session(
                 detail="You already have an active membership"
             )
 
-        amount = MEMBERSHIP_PRICES.get(payment_data.plan_type)
-        if not amount:
+        amount_cents = MEMBERSHIP_PRICES_CENTS.get(payment_data.plan_type)
+        if not amount_cents:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid membership plan"
             )
 
-        items = await get_checkout_items(price=int(amount * 100))
+        items = await get_checkout_items(price=amount_cents)
         session = await create_stripe_checkout_session(
             items=items,
             customer_email=current_user.email,
@@ -117,7 +182,7 @@ async def create_checkout_session(
 async def get_checkout_session(
     session_id: str,
 ):
-    session = await asyncify(stripe.checkout.Session.retrieve)(session_id)
+    session = await stripe.checkout.Session.retrieve_async(session_id)
     return {
         'status': session.status,
         'customer_email': session.customer_details.email,
@@ -125,17 +190,16 @@ async def get_checkout_session(
     }
 
 
-@router.post("/create-payment-intent")
+@router.post("/create-payment-intent", dependencies=[Depends(RateLimiter(times=10, minutes=1))])
 async def create_payment_intent(
     payment_data: CreatePaymentIntentSchema,
     current_user: OutUserSchema = Depends(require_candidate_role),
-    db: AsyncSession = Depends(get_db_session)
+    membership_crud: MembershipCrud = Depends(get_membership_crud)
 ):
     """Create a Stripe payment intent for membership subscription."""
     try:
         # Check if user already has an active membership
-        membership_crud = MembershipCrud(db)
-        active_membership = await membership_crud.get_active_membership_by_user_id(current_user.id)
+        active_membership = await get_cached_active_membership(membership_crud, current_user.id)
 
         if active_membership:
             raise HTTPException(
@@ -143,15 +207,16 @@ async def create_payment_intent(
                 detail="You already have an active membership"
             )
 
-        amount = MEMBERSHIP_PRICES.get(payment_data.plan_type)
-        if not amount:
+        amount_cents = MEMBERSHIP_PRICES_CENTS.get(payment_data.plan_type)
+        if not amount_cents:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid membership plan"
             )
 
-        intent = stripe.PaymentIntent.create(
-            amount=int(amount * 100),
+        intent = await stripe_call(
+            stripe.PaymentIntent.create_async,
+            amount=amount_cents,
             currency='usd',
             metadata={
                 'user_id': current_user.id,
@@ -163,7 +228,7 @@ async def create_payment_intent(
         return {
             "client_secret": intent.client_secret,
             "payment_intent_id": intent.id,
-            "amount": amount,
+            "amount": amount_cents / 100,
             "currency": "usd"
         }
 
@@ -178,12 +243,15 @@ async def create_payment_intent(
 async def confirm_payment(
     payment_data: PaymentConfirmationSchema,
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_candidate_role)
+    current_user: OutUserSchema = Depends(require_candidate_role),
+    membership_crud: MembershipCrud = Depends(get_membership_crud),
+    user_crud: UsersCrud = Depends(get_users_crud)
 ):
     """Confirm payment and activate membership."""
     try:
-        # Verify payment intent
-        intent = stripe.PaymentIntent.retrieve(payment_data.payment_intent_id)
+        intent = await stripe_call(
+            stripe.PaymentIntent.retrieve_async, payment_data.payment_intent_id
+        )
 
         if intent.status != 'succeeded':
             raise HTTPException(
@@ -199,11 +267,8 @@ async def confirm_payment(
             )
 
         # Create membership
-        membership_crud = MembershipCrud(db)
-        user_crud = UsersCrud(db)
-
-        start_date = datetime.now()
-        renewal_date = start_date + timedelta(days=30)  # 30-day subscription
+        start_date = _utcnow()
+        renewal_date = start_date + _MEMBERSHIP_DURATION
 
         membership_data = {
             "user_id": current_user.id,
@@ -215,11 +280,21 @@ async def confirm_payment(
             "stripe_payment_intent_id": payment_data.payment_intent_id
         }
 
-        membership = await membership_crud.create(membership_data)
-
-        await user_crud.activate_user(current_user.id)
+        # No pre-SELECT: the unique partial index on active memberships is
+        # the authoritative guard, so a concurrent duplicate surfaces as an
+        # IntegrityError instead of racing a check-then-insert
+        try:
+            membership = await membership_crud.create(membership_data)
+            await user_crud.activate_user(current_user.id)
+            await membership_crud.commit_session()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You already have an active membership"
+            )
 
-        await membership_crud.commit_session()
+        await invalidate_active_membership_cache(current_user.id)
 
         return OutMembershipSchema.model_validate(membership)
 
@@ -232,12 +307,11 @@ async def confirm_payment(
 
 @router.get("/my-membership", response_model=OutMembershipSchema)
 async def get_my_membership(
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_candidate_role)
+    current_user: OutUserSchema = Depends(require_candidate_role),
+    membership_crud: MembershipCrud = Depends(get_membership_crud)
 ):
     """Get current user's active membership."""
-    membership_crud = MembershipCrud(db)
-    membership = await membership_crud.get_active_membership_by_user_id(current_user.id)
+    membership = await get_cached_active_membership(membership_crud, current_user.id)
 
     if not membership:
         raise HTTPException(
@@ -245,32 +319,45 @@ async def get_my_membership(
             detail="No active membership found"
         )
 
-    return OutMembershipSchema.model_validate(membership)
+    return membership
+
+
+# Validates a whole history page in one pydantic-core pass instead of a
+# per-item model_validate loop
+_MEMBERSHIP_LIST_ADAPTER = TypeAdapter(List[OutMembershipSchema])
 
 
 @router.get("/history", response_model=List[OutMembershipSchema])
 async def get_membership_history(
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_candidate_role)
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None, ge=1),
+    current_user: OutUserSchema = Depends(require_candidate_role),
+    membership_crud: MembershipCrud = Depends(get_membership_crud)
 ):
-    """Get membership history for current user."""
-    membership_crud = MembershipCrud(db)
-    memberships = await membership_crud.get_memberships_by_user_id(current_user.id)
+    """Get a page of membership history for current user, newest first."""
+    memberships = await membership_crud.get_memberships_by_user_id(
+        current_user.id, limit=limit, before_id=before_id
+    )
 
-    return [OutMembershipSchema.model_validate(m) for m in memberships]
+    # Returning a Response keeps this a single validate+dump pass; the
+    # response_model stays for the OpenAPI schema
+    return Response(
+        content=_MEMBERSHIP_LIST_ADAPTER.dump_json(
+            _MEMBERSHIP_LIST_ADAPTER.validate_python(memberships, from_attributes=True)
+        ),
+        media_type="application/json"
+    )
 
 
 @router.post("/upgrade")
 async def upgrade_membership(
     new_plan: CreatePaymentIntentSchema,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_candidate_role)
+    current_user: OutUserSchema = Depends(require_candidate_role),
+    membership_crud: MembershipCrud = Depends(get_membership_crud)
 ):
     """Upgrade membership plan."""
-    membership_crud = MembershipCrud(db)
-
-    # Get current membership
-    current_membership = await membership_crud.get_active_membership_by_user_id(current_user.id)
+    # Get current membership (read-only here, so the cache is fine)
+    current_membership = await get_cached_active_membership(membership_crud, current_user.id)
     if not current_membership:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -278,8 +365,8 @@ async def upgrade_membership(
         )
 
     # Check if new plan is actually an upgrade
-    current_plan_value = list(MembershipPlan).index(current_membership.plan_type)
-    new_plan_value = list(MembershipPlan).index(new_plan.plan_type)
+    current_plan_value = _PLAN_RANK[current_membership.plan_type]
+    new_plan_value = _PLAN_RANK[new_plan.plan_type]
 
     if new_plan_value <= current_plan_value:
         raise HTTPException(
@@ -287,20 +374,19 @@ async def upgrade_membership(
             detail="New plan must be higher tier than current plan"
         )
 
-    # Calculate pro-rated amount
-    days_remaining = (current_membership.renewal_date - datetime.utcnow()).days
-    new_price = MEMBERSHIP_PRICES[new_plan.plan_type]
-    current_price = float(current_membership.price)
+    # Calculate pro-rated amount in integer cents to avoid FP rounding drift
+    days_remaining = (current_membership.renewal_date - _utcnow()).days
+    new_price_cents = MEMBERSHIP_PRICES_CENTS[new_plan.plan_type]
+    current_price_cents = round(float(current_membership.price) * 100)
 
     # Simple pro-ration calculation
-    daily_current = current_price / 30
-    daily_new = new_price / 30
-    upgrade_amount = (daily_new - daily_current) * days_remaining
+    upgrade_cents = (new_price_cents - current_price_cents) * days_remaining // 30
 
     try:
         # Create payment intent for upgrade
-        intent = stripe.PaymentIntent.create(
-            amount=int(upgrade_amount * 100),  # Amount in cents
+        intent = await stripe_call(
+            stripe.PaymentIntent.create_async,
+            amount=upgrade_cents,
             currency='usd',
             metadata={
                 'user_id': current_user.id,
@@ -312,7 +398,7 @@ async def upgrade_membership(
 
         return {
             "client_secret": intent.client_secret,
-            "amount": upgrade_amount,
+            "amount": upgrade_cents / 100,
             "currency": "usd",
             "message": "Complete payment to upgrade your membership"
         }
@@ -324,94 +410,158 @@ async def upgrade_membership(
         )
 
 
+# The plan catalogue is static, so build and serialize it once at import
+_PLANS_PAYLOAD = {
+    "plans": [
+        {
+            "plan": MembershipPlan.BASIC,
+            "price": MEMBERSHIP_PRICES[MembershipPlan.BASIC],
+            "features": [
+                "Apply to unlimited positions",
+                "Basic profile visibility",
+                "Email notifications"
+            ]
+        },
+        {
+            "plan": MembershipPlan.PREMIUM,
+            "price": MEMBERSHIP_PRICES[MembershipPlan.PREMIUM],
+            "features": [
+                "All Basic features",
+                "Priority in search results",
+                "Direct messaging with teams",
+                "Application tracking"
+            ]
+        },
+        {
+            "plan": MembershipPlan.PROFESSIONAL,
+            "price": MEMBERSHIP_PRICES[MembershipPlan.PROFESSIONAL],
+            "features": [
+                "All Premium features",
+                "Featured profile highlighting",
+                "Career consultation",
+                "Resume review service"
+            ]
+        }
+    ]
+}
+_PLANS_JSON = orjson.dumps(_PLANS_PAYLOAD)
+
+
 @router.get("/plans")
 async def get_membership_plans():
     """Get available membership plans and pricing."""
-    return {
-        "plans": [
-            {
-                "plan": MembershipPlan.BASIC,
-                "price": MEMBERSHIP_PRICES[MembershipPlan.BASIC],
-                "features": [
-                    "Apply to unlimited positions",
-                    "Basic profile visibility",
-                    "Email notifications"
-                ]
-            },
-            {
-                "plan": MembershipPlan.PREMIUM,
-                "price": MEMBERSHIP_PRICES[MembershipPlan.PREMIUM],
-                "features": [
-                    "All Basic features",
-                    "Priority in search results",
-                    "Direct messaging with teams",
-                    "Application tracking"
-                ]
-            },
-            {
-                "plan": MembershipPlan.PROFESSIONAL,
-                "price": MEMBERSHIP_PRICES[MembershipPlan.PROFESSIONAL],
-                "features": [
-                    "All Premium features",
-                    "Featured profile highlighting",
-                    "Career consultation",
-                    "Resume review service"
-                ]
-            }
-        ]
-    }
+    return Response(content=_PLANS_JSON, media_type="application/json")
 
 
-@router.post("/webhook")
-async def stripe_webhook(
-    request: Request,
-    db: AsyncSession = Depends(get_db_session)
-):
-    """Handle Stripe webhooks for payment confirmations."""
-    try:
-        # Get the webhook payload
-        payload = await request.body()
-        sig_header = request.headers.get('stripe-signature')
+# Stripe events are typically <50 KiB, so 1 MiB is a generous ceiling that
+# still bounds allocator pressure from oversized payloads
+_WEBHOOK_MAX_BODY = 1024 * 1024
+_WEBHOOK_TOLERANCE = 300  # seconds, same default as stripe.Webhook
 
-        if not sig_header:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No signature header"
-            )
 
-        # Verify webhook signature
-        try:
-            event = stripe.Webhook.construct_event(
-                payload, sig_header, settings.STRIPE_WEBHOOK_SECRET
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid payload"
-            )
-        except stripe.error.SignatureVerificationError as e:
+async def _read_and_verify_webhook(request: Request) -> dict:
+    """Stream the webhook body, verifying the Stripe signature incrementally.
+
+    Computes the HMAC chunk by chunk as the body arrives instead of
+    buffering it all and handing it to construct_event for a second pass,
+    and rejects payloads over the size cap before they are fully read.
+    """
+    sig_header = request.headers.get('stripe-signature')
+    if not sig_header:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No signature header"
+        )
+
+    timestamp = None
+    signatures = []
+    for part in sig_header.split(','):
+        key, _, value = part.strip().partition('=')
+        if key == 't':
+            timestamp = value
+        elif key == 'v1':
+            signatures.append(value)
+
+    if timestamp is None or not timestamp.isdigit() or not signatures:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid signature"
+        )
+
+    # Stripe signs "{timestamp}.{payload}"
+    hasher = hmac.new(
+        settings.stripe.STRIPE_WEBHOOK_SECRET.encode(),
+        f"{timestamp}.".encode(),
+        hashlib.sha256
+    )
+    chunks = []
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > _WEBHOOK_MAX_BODY:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid signature"
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Payload too large"
             )
+        hasher.update(chunk)
+        chunks.append(chunk)
 
-        # Handle the event
-        if event['type'] == 'payment_intent.succeeded':
-            payment_intent = event['data']['object']
-            await handle_payment_success(payment_intent, db)
-        elif event['type'] == 'payment_intent.payment_failed':
-            payment_intent = event['data']['object']
-            await handle_payment_failure(payment_intent, db)
+    expected = hasher.hexdigest()
+    if not any(hmac.compare_digest(expected, sig) for sig in signatures):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid signature"
+        )
 
-        return {"status": "success"}
+    if abs(time.time() - int(timestamp)) > _WEBHOOK_TOLERANCE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid signature"
+        )
 
-    except Exception as e:
+    try:
+        return orjson.loads(b"".join(chunks))
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Webhook error: {str(e)}"
+            detail="Invalid payload"
         )
 
 
+# Strong references so in-flight webhook tasks aren't garbage-collected
+_webhook_tasks: set = set()
+
+
+async def _process_event(event: dict) -> None:
+    """Process a verified Stripe event outside the request lifecycle.
+
+    Opens its own session because the request-scoped one is closed by the
+    time this runs.
+    """
+    async with async_session() as db:
+        try:
+            if event['type'] == 'payment_intent.succeeded':
+                await handle_payment_success(event['data']['object'], db)
+            elif event['type'] == 'payment_intent.payment_failed':
+                await handle_payment_failure(event['data']['object'], db)
+        except Exception:
+            logger.exception("Failed to process Stripe event %s", event.get('id'))
+
+
+@router.post("/webhook")
+async def stripe_webhook(request: Request):
+    """Handle Stripe webhooks for payment confirmations."""
+    event = await _read_and_verify_webhook(request)
+
+    # Acknowledge right away — Stripe retries webhooks that take >10 s —
+    # and run the DB work in a background task
+    task = asyncio.create_task(_process_event(event))
+    _webhook_tasks.add(task)
+    task.add_done_callback(_webhook_tasks.discard)
+
+    return {"status": "received"}
+
+
 async def handle_payment_success(payment_intent: dict, db: AsyncSession):
     """Handle successful payment."""
     membership_crud = MembershipCrud(db)
@@ -420,13 +570,8 @@ async def handle_payment_success(payment_intent: dict, db: AsyncSession):
     user_id = int(payment_intent['metadata'].get('user_id'))
     plan_type = MembershipPlan(payment_intent['metadata'].get('plan_type'))
 
-    # Check if membership already exists
-    existing_membership = await membership_crud.get_active_membership_by_user_id(user_id)
-    if existing_membership:
-        return  # Already processed
-
-    start_date = datetime.now()
-    renewal_date = start_date + timedelta(days=30)
+    start_date = _utcnow()
+    renewal_date = start_date + _MEMBERSHIP_DURATION
 
     membership_data = {
         "user_id": user_id,
@@ -438,25 +583,38 @@ async def handle_payment_success(payment_intent: dict, db: AsyncSession):
         "stripe_payment_intent_id": payment_intent['id']
     }
 
-    await membership_crud.create(membership_data)
-    await user_crud.activate_user(user_id)
-    await membership_crud.commit_session()
+    try:
+        await membership_crud.create(membership_data)
+        await user_crud.activate_user(user_id)
+        await membership_crud.commit_session()
+    except IntegrityError:
+        # Unique partial index tripped: this event was already processed
+        await db.rollback()
+        return
+
+    await invalidate_active_membership_cache(user_id)
 
 
 async def handle_payment_failure(payment_intent: dict, db: AsyncSession):
     """Handle failed payment."""
-    # Log the failure for monitoring
-    print(f"Payment failed for user {payment_intent['metadata'].get('user_id')}")
+    # The root logger writes through a QueueHandler, so this never blocks
+    # the event loop on stdout
+    logger.warning(
+        "stripe.payment_failed",
+        extra={
+            "user_id": payment_intent['metadata'].get('user_id'),
+            "payment_intent_id": payment_intent.get('id'),
+        },
+    )
     # In production, you might want to send an email to the user
 
 
 @router.put("/change_membership")
 async def change_membership(
     new_plan: CreatePaymentIntentSchema,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_candidate_role)
+    current_user: OutUserSchema = Depends(require_candidate_role),
+    membership_crud: MembershipCrud = Depends(get_membership_crud)
 ):
-    membership_crud = MembershipCrud(db)
     current_membership = await membership_crud.get_active_membership_by_user_id(current_user.id)
 
     if not current_membership:
@@ -472,25 +630,24 @@ async def change_membership(
             detail="You are already on this plan"
         )
 
-    now = datetime.utcnow()
+    now = _utcnow()
     days_remaining = max(0, (current_membership.renewal_date - now).days)
-    new_price = MEMBERSHIP_PRICES[new_plan.plan_type]
-    current_price = float(current_membership.price)
+    new_price_cents = MEMBERSHIP_PRICES_CENTS[new_plan.plan_type]
+    current_price_cents = round(float(current_membership.price) * 100)
 
-    # Pro-rata calculation
-    daily_current = current_price / 30
-    daily_new = new_price / 30
-    change_amount = round((daily_new - daily_current) * days_remaining, 2)
+    # Pro-rata calculation in integer cents
+    change_cents = (new_price_cents - current_price_cents) * days_remaining // 30
 
     current_membership.plan_type = new_plan.plan_type.value  # ✅ Save string to DB
-    current_membership.price = new_price
-    current_membership.renewal_date = now + timedelta(days=30)
+    current_membership.price = MEMBERSHIP_PRICES[new_plan.plan_type]
+    current_membership.renewal_date = now + _MEMBERSHIP_DURATION
     current_membership.status = MembershipStatus.ACTIVE.value  # ✅ Save string to DB
 
     await membership_crud.commit_session()
+    await invalidate_active_membership_cache(current_user.id)
 
     return {
-        "amount": change_amount,
+        "amount": change_cents / 100,
         "currency": "usd",
         "message": "Complete payment to upgrade your membership"
     }
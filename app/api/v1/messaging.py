@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.dependencies.crud import get_message_crud, get_users_crud
 from api.dependencies.database import get_db_session
 from api.dependencies.user import get_current_active_user
 from db.crud.message import MessageCrud
@@ -28,44 +30,41 @@ router = APIRouter(
 async def send_message(
     message_data: CreateMessageSchema,
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud)
 ):
     """Send a message to another user."""
-    message_crud = MessageCrud(db)
-    user_crud = UsersCrud(db)
-    
-    # Check if receiver exists
-    receiver = await user_crud.get_by_id(message_data.receiver_id)
-    if not receiver:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Receiver not found"
-        )
-    
     # Don't allow sending messages to yourself
     if message_data.receiver_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot send message to yourself"
         )
-    
-    # Create message
+
+    # Create message; the foreign key already enforces receiver existence,
+    # so skip the lookup round-trip and translate an FK violation into 404
     message_dict = message_data.model_dump()
     message_dict["sender_id"] = current_user.id
-    
-    message = await message_crud.create(message_dict)
-    await message_crud.commit_session()
-    
+
+    try:
+        message = await message_crud.create(message_dict)
+        await message_crud.commit_session()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Receiver not found"
+        )
+
     return OutMessageSchema.model_validate(message)
 
 
 @router.get("/threads", response_model=List[MessageThreadSchema])
 async def get_message_threads(
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud)
 ):
     """Get message threads for current user."""
-    message_crud = MessageCrud(db)
     threads = await message_crud.get_message_threads(current_user.id)
     
     return threads
@@ -74,13 +73,14 @@ async def get_message_threads(
 @router.get("/conversation/{user_id}", response_model=List[OutMessageSchema])
 async def get_conversation(
     user_id: int,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None, ge=1),
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud),
+    user_crud: UsersCrud = Depends(get_users_crud)
 ):
-    """Get conversation with a specific user."""
-    message_crud = MessageCrud(db)
-    user_crud = UsersCrud(db)
-    
+    """Get a page of the conversation with a specific user, newest first."""
+
     # Check if the other user exists
     other_user = await user_crud.get_by_id(user_id)
     if not other_user:
@@ -89,36 +89,32 @@ async def get_conversation(
             detail="User not found"
         )
     
-    # Get conversation
-    messages = await message_crud.get_conversation(current_user.id, user_id)
-    
-    # Mark messages as read
-    await message_crud.mark_conversation_as_read(current_user.id, user_id)
-    
-    return [OutMessageSchema.model_validate(msg) for msg in messages]
+    # Get conversation and mark it read in a single SQL round-trip; the
+    # response_model does the one validation pass, serialized via orjson
+    return await message_crud.get_conversation_and_mark_read(
+        current_user.id, user_id, limit=limit, before_id=before_id
+    )
 
 
 @router.get("/unread", response_model=List[OutMessageSchema])
 async def get_unread_messages(
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud),
+    limit: int = Query(100, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all unread messages for current user."""
-    message_crud = MessageCrud(db)
-    messages = await message_crud.get_unread_messages(current_user.id)
-    
-    return [OutMessageSchema.model_validate(msg) for msg in messages]
+    """Get a page of unread messages for the current user."""
+    return await message_crud.get_unread_messages(current_user.id, limit=limit, offset=offset)
 
 
 @router.patch("/{message_id}/read", response_model=OutMessageSchema)
 async def mark_message_as_read(
     message_id: int,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud)
 ):
     """Mark a message as read."""
-    message_crud = MessageCrud(db)
-    
+
     message = await message_crud.get_by_id(message_id)
     if not message:
         raise HTTPException(
@@ -141,12 +137,11 @@ async def mark_message_as_read(
 @router.get("/{message_id}", response_model=OutMessageSchema)
 async def get_message(
     message_id: int,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud)
 ):
     """Get a specific message."""
-    message_crud = MessageCrud(db)
-    
+
     message = await message_crud.get_by_id(message_id)
     if not message:
         raise HTTPException(
@@ -168,12 +163,11 @@ async def get_message(
 async def reply_to_message(
     message_id: int,
     reply_content: CreateMessageSchema,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud)
 ):
     """Reply to a specific message."""
-    message_crud = MessageCrud(db)
-    
+
     # Get original message
     original_message = await message_crud.get_by_id(message_id)
     if not original_message:
@@ -210,12 +204,13 @@ async def reply_to_message(
 @router.get("/{message_id}/replies", response_model=List[OutMessageSchema])
 async def get_message_replies(
     message_id: int,
-    db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(get_current_active_user)
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None, ge=1),
+    current_user: OutUserSchema = Depends(get_current_active_user),
+    message_crud: MessageCrud = Depends(get_message_crud)
 ):
-    """Get all replies to a message."""
-    message_crud = MessageCrud(db)
-    
+    """Get a page of replies to a message, newest first."""
+
     # Check if original message exists and user has permission
     original_message = await message_crud.get_by_id(message_id)
     if not original_message:
@@ -230,6 +225,6 @@ async def get_message_replies(
             detail="You don't have permission to view replies to this message"
         )
     
-    replies = await message_crud.get_replies_to_message(message_id)
-    
-    return [OutMessageSchema.model_validate(reply) for reply in replies] 
\ No newline at end of file
+    return await message_crud.get_replies_to_message(
+        message_id, limit=limit, before_id=before_id
+    )
\ No newline at end of file
@@ -1,13 +1,173 @@
-import os
+import asyncio
+import time
+from operator import attrgetter
+
 import stripe
 from fastapi import HTTPException, Request, APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from celery_config import celery_app
+from core.config import settings
 from schemas.payment import UpdateSubscriptionRequest, CustomerRequest, SubscriptionRequest
-from dotenv import load_dotenv
+from utils.redis_manager import RedisManager
+from utils.stripe_utils import stripe_call
+
+# The key comes from the shared settings object and every call goes through
+# the pooled stripe.default_http_client installed in the app lifespan, so
+# sockets to api.stripe.com are reused instead of paying a TLS handshake
+# per request
+stripe.api_key = settings.stripe.STRIPE_SECRET_KEY
+
+# The Stripe price catalogue changes rarely but each Price.list round-trip
+# costs hundreds of milliseconds, so serve /plans from Redis and invalidate
+# from the price/product webhook events
+_PLANS_CACHE_KEY = "stripe:plans:active_recurring"
+_PLANS_CACHE_TTL = settings.REDIS_TTL * 60  # settings value is in minutes
+
+# Subscription reads dominate response time at ~500ms per Stripe round-trip;
+# cache a small projection briefly and invalidate on every write path
+_SUB_CACHE_TTL = 300  # seconds
+
+
+def _sub_cache_key(subscription_id: str) -> str:
+    return f"stripe_sub:{subscription_id}"
+
+
+# Per-customer subscription lists change only through writes or webhooks,
+# so serve them locally and fall back to Stripe on miss or ?refresh=true
+_CUSTOMER_SUBS_TTL = 600  # seconds
+
+
+def _customer_subs_cache_key(customer_id: str) -> str:
+    return f"stripe_customer_subs:{customer_id}"
+
+
+_SUB_KEYS = (
+    "id", "status", "current_period_start", "current_period_end",
+    "cancel_at_period_end"
+)
+_sub_get = attrgetter(*_SUB_KEYS)
+
+
+# Subscription item ids are stable between plan changes, so caching them
+# saves the retrieve round-trip that update_subscription otherwise makes
+# just to read items.data[0].id
+_SUB_ITEM_CACHE_TTL = 600  # seconds
+
+
+def _sub_item_cache_key(subscription_id: str) -> str:
+    return f"stripe_sub_item:{subscription_id}"
+
+
+async def _get_subscription_item_id(subscription_id: str) -> str:
+    item_id = await RedisManager.get(_sub_item_cache_key(subscription_id))
+    if item_id is not None:
+        return item_id
+
+    subscription = await stripe_call(stripe.Subscription.retrieve_async, subscription_id)
+    item_id = subscription['items']['data'][0].id
+    await RedisManager.set(
+        _sub_item_cache_key(subscription_id), item_id, ex=_SUB_ITEM_CACHE_TTL
+    )
+    return item_id
+
+
+# Individual price lookups go through a per-process TTL dict in front of
+# Redis, and any misses are fetched concurrently in one gather instead of
+# sequential retrieves
+_PRICE_CACHE_TTL = 3600  # seconds
+_price_cache: dict = {}
+
+
+def _price_cache_key(price_id: str) -> str:
+    return f"stripe_price:{price_id}"
+
+
+# attrgetter descends dotted paths in C, so projecting a full Price list
+# skips the per-attribute bytecode a dict literal would execute
+_PRICE_KEYS = ("id", "amount", "currency", "interval", "interval_count", "product")
+_price_get = attrgetter(
+    "id", "unit_amount", "currency",
+    "recurring.interval", "recurring.interval_count", "product"
+)
+
 
-load_dotenv()
+def _project_price(price) -> dict:
+    return dict(zip(_PRICE_KEYS, _price_get(price)))
 
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+
+def _remember_price_local(projection: dict) -> None:
+    _price_cache[projection["id"]] = (time.monotonic() + _PRICE_CACHE_TTL, projection)
+
+
+async def _remember_price(projection: dict) -> None:
+    _remember_price_local(projection)
+    await RedisManager.set(
+        _price_cache_key(projection["id"]), projection, ex=_PRICE_CACHE_TTL
+    )
+
+
+async def get_prices(price_ids: list) -> dict:
+    """Resolve price projections by id, fetching cache misses concurrently."""
+    now = time.monotonic()
+    found = {}
+    missing = []
+    for price_id in price_ids:
+        entry = _price_cache.get(price_id)
+        if entry and entry[0] > now:
+            found[price_id] = entry[1]
+        else:
+            missing.append(price_id)
+
+    still_missing = []
+    for price_id in missing:
+        cached = await RedisManager.get(_price_cache_key(price_id))
+        if cached is not None:
+            _remember_price_local(cached)
+            found[price_id] = cached
+        else:
+            still_missing.append(price_id)
+
+    if still_missing:
+        # Price.list has no id filter, so misses are retrieved one by one;
+        # gathering them keeps the latency at one round-trip while
+        # stripe_call's semaphore and token bucket bound the burst
+        prices = await asyncio.gather(
+            *(
+                stripe_call(stripe.Price.retrieve_async, price_id)
+                for price_id in still_missing
+            )
+        )
+        for price in prices:
+            projection = _project_price(price)
+            await _remember_price(projection)
+            found[projection["id"]] = projection
+
+    return found
+
+
+async def get_price(price_id: str):
+    """Resolve a single price projection through the shared cache."""
+    return (await get_prices([price_id])).get(price_id)
+
+
+async def _get_subscription_cached(subscription_id: str) -> dict:
+    """Fetch a subscription projection through the Redis cache."""
+    key = _sub_cache_key(subscription_id)
+    cached = await RedisManager.get(key)
+    if cached is not None:
+        return cached
+
+    subscription = await stripe_call(stripe.Subscription.retrieve_async, subscription_id)
+    projection = {
+        "subscription_id": subscription.id,
+        "customer_id": subscription.customer,
+        "status": subscription.status,
+        "current_period_start": subscription.current_period_start,
+        "current_period_end": subscription.current_period_end,
+        "cancel_at_period_end": subscription.cancel_at_period_end
+    }
+    await RedisManager.set(key, projection, ex=_SUB_CACHE_TTL)
+    return projection
 
 router = APIRouter(
     prefix="/payment", tags=["Payment"]
@@ -17,7 +177,8 @@ router = APIRouter(
 @router.post("/create-customer")
 async def create_customer(customer_request: CustomerRequest):
     try:
-        customer = stripe.Customer.create(
+        customer = await stripe_call(
+            stripe.Customer.create_async,
             email=customer_request.email,
             name=customer_request.name
         )
@@ -44,7 +205,7 @@ async def create_subscription(subscription_request: SubscriptionRequest):
         if subscription_request.trial_period_days > 0:
             subscription_params["trial_period_days"] = subscription_request.trial_period_days
 
-        subscription = stripe.Subscription.create(**subscription_params)
+        subscription = await stripe_call(stripe.Subscription.create_async, **subscription_params)
 
         return {
             "subscription_id": subscription.id,
@@ -58,15 +219,7 @@ async def create_subscription(subscription_request: SubscriptionRequest):
 @router.get("/subscription/{subscription_id}")
 async def get_subscription(subscription_id: str):
     try:
-        subscription = stripe.Subscription.retrieve(subscription_id)
-        return {
-            "subscription_id": subscription.id,
-            "customer_id": subscription.customer,
-            "status": subscription.status,
-            "current_period_start": subscription.current_period_start,
-            "current_period_end": subscription.current_period_end,
-            "cancel_at_period_end": subscription.cancel_at_period_end
-        }
+        return await _get_subscription_cached(subscription_id)
     except stripe.error.StripeError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -74,15 +227,17 @@ async def get_subscription(subscription_id: str):
 @router.put("/update-subscription")
 async def update_subscription(update_request: UpdateSubscriptionRequest):
     try:
-        subscription = stripe.Subscription.retrieve(update_request.subscription_id)
+        item_id = await _get_subscription_item_id(update_request.subscription_id)
 
-        stripe.Subscription.modify(
+        await stripe_call(
+            stripe.Subscription.modify_async,
             update_request.subscription_id,
             items=[{
-                'id': subscription['items']['data'][0].id,
+                'id': item_id,
                 'price': update_request.new_price_id,
             }]
         )
+        await RedisManager.delete(_sub_cache_key(update_request.subscription_id))
 
         return {"message": "Subscription updated successfully"}
     except stripe.error.StripeError as e:
@@ -93,12 +248,14 @@ async def update_subscription(update_request: UpdateSubscriptionRequest):
 async def cancel_subscription(subscription_id: str, cancel_immediately: bool = False):
     try:
         if cancel_immediately:
-            subscription = stripe.Subscription.delete(subscription_id)
+            subscription = await stripe_call(stripe.Subscription.delete_async, subscription_id)
         else:
-            subscription = stripe.Subscription.modify(
+            subscription = await stripe_call(
+                stripe.Subscription.modify_async,
                 subscription_id,
                 cancel_at_period_end=True
             )
+        await RedisManager.delete(_sub_cache_key(subscription_id))
 
         return {
             "subscription_id": subscription.id,
@@ -113,10 +270,12 @@ async def cancel_subscription(subscription_id: str, cancel_immediately: bool = F
 @router.post("/resume-subscription/{subscription_id}")
 async def resume_subscription(subscription_id: str):
     try:
-        subscription = stripe.Subscription.modify(
+        subscription = await stripe_call(
+            stripe.Subscription.modify_async,
             subscription_id,
             cancel_at_period_end=False
         )
+        await RedisManager.delete(_sub_cache_key(subscription_id))
 
         return {
             "subscription_id": subscription.id,
@@ -128,25 +287,28 @@ async def resume_subscription(subscription_id: str):
 
 
 @router.get("/customer/{customer_id}/subscriptions")
-async def get_customer_subscriptions(customer_id: str):
+async def get_customer_subscriptions(customer_id: str, refresh: bool = False):
+    key = _customer_subs_cache_key(customer_id)
+    if not refresh:
+        cached = await RedisManager.get(key)
+        if cached is not None:
+            return cached
+
     try:
-        subscriptions = stripe.Subscription.list(
+        subscriptions = await stripe_call(
+            stripe.Subscription.list_async,
             customer=customer_id,
             limit=10
         )
 
-        return {
+        payload = {
             "subscriptions": [
-                {
-                    "id": sub.id,
-                    "status": sub.status,
-                    "current_period_start": sub.current_period_start,
-                    "current_period_end": sub.current_period_end,
-                    "cancel_at_period_end": sub.cancel_at_period_end
-                }
+                dict(zip(_SUB_KEYS, _sub_get(sub)))
                 for sub in subscriptions.data
             ]
         }
+        await RedisManager.set(key, payload, ex=_CUSTOMER_SUBS_TTL)
+        return payload
     except stripe.error.StripeError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -155,10 +317,12 @@ async def get_customer_subscriptions(customer_id: str):
 async def stripe_webhook(request: Request):
     payload = await request.body()
     sig_header = request.headers.get('stripe-signature')
-    endpoint_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
+    endpoint_secret = settings.stripe.STRIPE_WEBHOOK_SECRET
 
     try:
-        event = stripe.Webhook.construct_event(
+        # Signature verification is CPU-only; keep it off the event loop
+        event = await asyncio.to_thread(
+            stripe.Webhook.construct_event,
             payload, sig_header, endpoint_secret
         )
     except ValueError:
@@ -166,62 +330,54 @@ async def stripe_webhook(request: Request):
     except stripe.error.SignatureVerificationError:
         raise HTTPException(status_code=400, detail="Invalid signature")
 
-    # Handle subscription-specific events
-    if event['type'] == 'customer.subscription.created':
-        subscription = event['data']['object']
-        print(f"New subscription created: {subscription['id']}")
-        # Add user to subscription in your database
-
-    elif event['type'] == 'customer.subscription.updated':
+    # Drop any cached projections the event invalidates before enqueueing,
+    # so reads right after the 200 don't serve stale data
+    if event['type'].startswith('customer.subscription.'):
         subscription = event['data']['object']
-        print(f"Subscription updated: {subscription['id']}")
-        # Update subscription status in your database
+        await RedisManager.delete(_sub_cache_key(subscription['id']))
+        await RedisManager.delete(_sub_item_cache_key(subscription['id']))
+        await RedisManager.delete(_customer_subs_cache_key(subscription['customer']))
 
-    elif event['type'] == 'customer.subscription.deleted':
-        subscription = event['data']['object']
-        print(f"Subscription canceled: {subscription['id']}")
-        # Remove user access in your database
-
-    elif event['type'] == 'invoice.payment_succeeded':
+    elif event['type'] in ('invoice.payment_succeeded', 'invoice.payment_failed'):
         invoice = event['data']['object']
-        print(f"Subscription payment succeeded: {invoice['subscription']}")
-        # Extend user access period
+        if invoice.get('subscription'):
+            await RedisManager.delete(_sub_cache_key(invoice['subscription']))
+        if invoice.get('customer'):
+            await RedisManager.delete(_customer_subs_cache_key(invoice['customer']))
 
-    elif event['type'] == 'invoice.payment_failed':
-        invoice = event['data']['object']
-        print(f"Subscription payment failed: {invoice['subscription']}")
+    elif event['type'] in ('price.updated', 'product.updated', 'plan.updated'):
+        # Catalogue changed — drop the cached /plans payload
+        await RedisManager.delete(_PLANS_CACHE_KEY)
 
-    elif event['type'] == 'customer.subscription.trial_will_end':
-        subscription = event['data']['object']
-        # TODO: send notifs
-        print(f"Trial ending soon: {subscription['id']}")
-
-    else:
-        print(f"Unhandled event type: {event['type']}")
+    # Hand the event to a Celery worker and acknowledge immediately —
+    # Stripe retries webhooks that respond slowly
+    celery_app.send_task(
+        "handle_stripe_event",
+        args=[event['type'], event['data']['object']],
+        queue="default",
+    )
 
-    return JSONResponse(content={"status": "success"})
+    return ORJSONResponse(content={"status": "success"})
 
 
 @router.get("/plans")
 async def get_plans():
+    cached = await RedisManager.get(_PLANS_CACHE_KEY)
+    if cached is not None:
+        return cached
+
     try:
-        prices = stripe.Price.list(
+        prices = await stripe_call(
+            stripe.Price.list_async,
             active=True,
             type='recurring'
         )
 
-        return {
-            "plans": [
-                {
-                    "id": price.id,
-                    "amount": price.unit_amount,
-                    "currency": price.currency,
-                    "interval": price.recurring.interval,
-                    "interval_count": price.recurring.interval_count,
-                    "product": price.product
-                }
-                for price in prices.data
-            ]
-        }
+        plans = {"plans": [_project_price(price) for price in prices.data]}
+        # Seed the per-price cache so subscription flows reuse this pull
+        for projection in plans["plans"]:
+            await _remember_price(projection)
+        await RedisManager.set(_PLANS_CACHE_KEY, plans, ex=_PLANS_CACHE_TTL)
+        return plans
     except stripe.error.StripeError as e:
         raise HTTPException(status_code=400, detail=str(e))
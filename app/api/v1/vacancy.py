@@ -1,9 +1,10 @@
+import base64
+import binascii
 from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies.database import get_db_session
@@ -11,13 +12,13 @@ from api.dependencies.pagination import PaginationDep
 from api.dependencies.user import get_current_active_user
 from db.crud.vacancy import VacancyCrud
 from db.tables.user import UserRole
-from db.tables.vacancy import VacancyStatus, Vacancy
+from db.tables.vacancy import VacancyStatus
 from schemas.vacancy import (
     CreateVacancySchema,
     UpdateVacancySchema,
     OutVacancySchema,
     PaginatedVacancySchema,
-    VacancySearchSchema, PaginatedVacancyListSchema, OutVacancyListSchema
+    VacancySearchSchema, PaginatedVacancyListSchema
 )
 from schemas.user import OutUserSchema
 
@@ -28,6 +29,21 @@ router = APIRouter(
 )
 
 
+def _encode_cursor(created_at: datetime, vacancy_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{vacancy_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at_raw, id_raw = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at_raw), int(id_raw)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 def require_team_role(current_user: OutUserSchema = Depends(get_current_active_user)) -> OutUserSchema:
     """Require user to be a team."""
     if current_user.role != UserRole.TEAM:
@@ -43,9 +59,6 @@ def require_team_role(current_user: OutUserSchema = Depends(get_current_active_u
     return current_user
 
 
-from datetime import datetime
-
-
 @router.post("", response_model=OutVacancySchema, status_code=status.HTTP_201_CREATED)
 async def create_vacancy(
     vacancy_data: CreateVacancySchema,
@@ -55,23 +68,17 @@ async def create_vacancy(
     """Create a new vacancy."""
     vacancy_crud = VacancyCrud(db)
 
-    # Convert Pydantic model to dict
+    # expiry_date is normalized to naive UTC by the column type at bind time
     vacancy_dict = vacancy_data.model_dump()
 
-    # Ensure expiry_date is UTC without tzinfo
-    expiry_date = vacancy_dict.get("expiry_date")
-    if expiry_date and isinstance(expiry_date, datetime) and expiry_date.tzinfo:
-        expiry_date = expiry_date.astimezone(datetime.timezone.utc)  # Convert to UTC
-        vacancy_dict["expiry_date"] = expiry_date.replace(tzinfo=None)  # Remove tzinfo
-
     # Add team_id
     vacancy_dict["team_id"] = current_user.id
 
-    # Create the vacancy
+    # Create the vacancy; response_model performs the single validation pass
     vacancy = await vacancy_crud.create(vacancy_dict)
     await vacancy_crud.commit_session()
 
-    return OutVacancySchema.model_validate(vacancy)
+    return vacancy
 
 
 @router.get("", response_model=PaginatedVacancyListSchema)
@@ -83,12 +90,17 @@ async def list_vacancies(
     salary_min: Optional[float] = Query(None, description="Minimum salary"),
     salary_max: Optional[float] = Query(None, description="Maximum salary"),
     experience_level: Optional[str] = Query(None, description="Filter by experience level"),
-    position_type: Optional[str] = Query(None, description="Filter by position type")
+    position_type: Optional[str] = Query(None, description="Filter by position type"),
+    cursor: Optional[str] = Query(
+        None, description="Opaque cursor from a previous page; skips the total count"
+    )
 ):
     """List all active vacancies with optional filters."""
     vacancy_crud = VacancyCrud(db)
 
-    search_params = VacancySearchSchema(
+    # Query params were already validated/coerced by FastAPI above, so
+    # the carrier schema can skip a second pydantic pass
+    search_params = VacancySearchSchema.model_construct(
         role=role,
         location=location,
         salary_min=salary_min,
@@ -100,47 +112,56 @@ async def list_vacancies(
     vacancies, total_count = await vacancy_crud.search_vacancies(
         search_params,
         limit=pagination.limit,
-        offset=pagination.offset
+        offset=pagination.offset,
+        cursor=_decode_cursor(cursor) if cursor else None
     )
 
-    response_items = []
-    for vacancy in vacancies:
-        item = OutVacancyListSchema.model_validate(vacancy)
-        if vacancy.team:
-            item.team_name = vacancy.team.club_name
-        response_items.append(item)
+    next_cursor = None
+    if len(vacancies) == pagination.limit:
+        last = vacancies[-1]
+        next_cursor = _encode_cursor(last.created_at, last.id)
 
-    return PaginatedVacancyListSchema(
-        items=response_items,
-        total=total_count,
-        limit=pagination.limit,
-        offset=pagination.offset
-    )
+    # response_model validates the whole page in one pydantic-core pass;
+    # team_name is resolved by OutVacancyListSchema's alias path
+    return {
+        "items": vacancies,
+        "total": total_count,
+        "limit": pagination.limit,
+        "offset": pagination.offset,
+        "next_cursor": next_cursor
+    }
 
 
 @router.get("/my-vacancies", response_model=List[OutVacancySchema])
 async def get_my_vacancies(
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_team_role)
+    current_user: OutUserSchema = Depends(require_team_role),
+    limit: int = Query(100, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all vacancies for the current team."""
+    """Get a page of the current team's vacancies."""
     vacancy_crud = VacancyCrud(db)
-    vacancies = await vacancy_crud.get_vacancies_by_team_id(current_user.id)
+    vacancies = await vacancy_crud.get_vacancies_by_team_id(
+        current_user.id, limit=limit, offset=offset
+    )
 
-    return [OutVacancySchema.model_validate(v) for v in vacancies]
+    return vacancies
 
 
-@router.get("/vacancies/active", response_model=List[OutVacancySchema])
-async def get_my_vacancies(
+@router.get("/active", response_model=List[OutVacancySchema])
+async def get_active_vacancies(
     db: AsyncSession = Depends(get_db_session),
-    current_user: OutUserSchema = Depends(require_team_role)
+    current_user: OutUserSchema = Depends(require_team_role),
+    limit: int = Query(100, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """Get all vacancies for the current team."""
+    """Get a page of the current team's active vacancies."""
     vacancy_crud = VacancyCrud(db)
-    vacancies = await vacancy_crud.get_active_vacancies(team_id=current_user.id)
+    vacancies = await vacancy_crud.get_active_vacancies(
+        team_id=current_user.id, limit=limit, offset=offset
+    )
 
-    # Convert ORM models to Pydantic schemas
-    return [OutVacancySchema.model_validate(v) for v in vacancies]
+    return vacancies
 
 
 @router.get("/{vacancy_id}", response_model=OutVacancySchema)
@@ -159,7 +180,7 @@ async def get_vacancy(
             detail="Vacancy not found"
         )
 
-    return OutVacancySchema.model_validate(vacancy)
+    return vacancy
 
 
 @router.post("/vacancies/activate", response_model=OutVacancySchema)
@@ -169,34 +190,19 @@ async def activate_vacancy(
     current_user: OutUserSchema = Depends(require_team_role)
 ):
     """Activate a specific vacancy."""
+    vacancy_crud = VacancyCrud(db)
 
-    # Query the vacancy directly using SQLAlchemy
-    result = await db.execute(
-        select(Vacancy).where(Vacancy.id == vacancy_id)
+    # Single UPDATE…RETURNING; ownership is part of the WHERE clause
+    vacancy = await vacancy_crud.update_status_owned(
+        vacancy_id, current_user.id, VacancyStatus.ACTIVE
     )
-    vacancy = result.scalars().first()
-
-    # Ensure the vacancy exists
-    if not vacancy:
+    if vacancy is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Vacancy not found"
-        )
-
-    # Ensure the current user is the owner of the vacancy
-    if vacancy.team_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only activate your own vacancies"
+            detail="Vacancy not found or you can only activate your own vacancies"
         )
 
-    # Change the vacancy status to ACTIVE
-    vacancy.status = VacancyStatus.ACTIVE
-    await db.commit()
-    await db.refresh(vacancy)
-
-    # Convert to Pydantic schema before returning
-    return OutVacancySchema.model_validate(vacancy)
+    return vacancy
 
 
 @router.put("/{vacancy_id}", response_model=OutVacancySchema)
@@ -220,7 +226,7 @@ async def update_vacancy(
             detail="You are not authorized to update this vacancy or it does not exist"
         )
 
-    return OutVacancySchema.model_validate(updated_vacancy)
+    return updated_vacancy
 
 
 @router.delete("/{vacancy_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -258,22 +264,13 @@ async def close_vacancy(
     """Close a vacancy."""
     vacancy_crud = VacancyCrud(db)
 
-    # Fetch the vacancy
-    vacancy = await vacancy_crud.get_by_id(vacancy_id)
-    if not vacancy:
+    vacancy = await vacancy_crud.update_status_owned(
+        vacancy_id, current_user.id, VacancyStatus.CLOSED
+    )
+    if vacancy is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Vacancy not found"
+            detail="Vacancy not found or you can only close your own vacancies"
         )
 
-    # Check ownership
-    if vacancy.team_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only close your own vacancies"
-        )
-
-    # Close the vacancy
-    closed_vacancy = await vacancy_crud.close_vacancy(vacancy_id)
-
-    return closed_vacancy
+    return vacancy
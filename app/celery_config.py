@@ -25,7 +25,26 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,
     task_retry_on_failure=True,
     broker_connection_retry_on_startup=True,
-    worker_prefetch_multiplier=4,
+    # Tasks here are short I/O-bound fanout (Stripe events, email, SMS):
+    # a gevent pool holds hundreds of concurrent HTTP calls per worker
+    # where the prefork default would hold one per process. The pool must
+    # also be selected with -P gevent on the worker command line — celery
+    # only monkey-patches the stdlib when it sees the pool in argv/env,
+    # before this module is even imported
+    worker_pool="gevent",
+    worker_concurrency=200,
+    # The gevent pool does not enforce these time limits — hung tasks are
+    # bounded instead by per-call HTTP timeouts in the email and SMS
+    # clients (utils/email.py, utils/sms.py). The limits are kept so a
+    # prefork run of the same app still gets them
+    task_soft_time_limit=25,
+    task_time_limit=30,
+    # With acks_late, prefetching batches just delays redelivery of work
+    # a busy worker is sitting on
+    worker_prefetch_multiplier=1,
+    # Stripe event payloads and rendered emails compress well; saves
+    # Redis broker bandwidth
+    task_compression="gzip",
     worker_max_tasks_per_child=1000,
     task_default_queue="default",
     task_routes={
@@ -39,5 +58,6 @@ celery_app.autodiscover_tasks(
     [
         "tasks.notifications",
         "tasks.notifications.send_email",
+        "tasks.stripe_events",
     ]
 )
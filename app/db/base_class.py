@@ -1,12 +1,63 @@
+import enum
 import re
 import datetime
 from typing import Optional
 
-from sqlalchemy import func, DateTime
+from sqlalchemy import func, DateTime, Enum as SQLEnum, TypeDecorator
 from sqlalchemy.orm import as_declarative, declared_attr, mapped_column, Mapped
 from core.config import settings, EnvironmentEnum
 
 
+class LowercaseStrEnum(str, enum.Enum):
+    """str-enum whose members are looked up case-insensitively.
+
+    Legacy uppercase labels (and clients still sending them) resolve via
+    _missing_ once at enum-lookup time, so response schemas need no
+    per-row lowercasing validators.
+    """
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str) and value != value.lower():
+            try:
+                return cls(value.lower())
+            except ValueError:
+                return None
+        return None
+
+
+def values_enum(enum_cls) -> SQLEnum:
+    """Enum column type that persists member values (lowercase) as labels.
+
+    Rows then come back from Postgres already matching the Python enum
+    values, whether hydrated through the ORM or a plain Core select.
+    """
+    return SQLEnum(enum_cls, values_callable=lambda e: [m.value for m in e])
+
+
+class NaiveUTCDateTime(TypeDecorator):
+    """DateTime normalized to tz-naive UTC at the column boundary.
+
+    Aware values are converted once during bind/result processing, so
+    schemas need no per-field tz-stripping validators on every row.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    @staticmethod
+    def _to_naive_utc(value):
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_bind_param(self, value, dialect):
+        return self._to_naive_utc(value)
+
+    def process_result_value(self, value, dialect):
+        return self._to_naive_utc(value)
+
+
 def camel_to_snake(name):
     """
     Convert camel case to snake case and lowercase the result
@@ -19,12 +70,12 @@ def camel_to_snake(name):
 class TimestampedBase:
     id: Mapped[int] = mapped_column(primary_key=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True),
+        NaiveUTCDateTime(timezone=True),
         nullable=False,
         server_default=func.current_timestamp()
     )
     updated_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True),
+        NaiveUTCDateTime(timezone=True),
         nullable=False,
         server_default=func.current_timestamp(),
         onupdate=func.current_timestamp(),
@@ -1,11 +1,14 @@
 from typing import Optional, List, Type
 
 from fastapi import HTTPException
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload, InstrumentedAttribute
+from sqlalchemy import select, and_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import selectinload, contains_eager, raiseload, InstrumentedAttribute
 
 from db.crud.base import BaseCrud
 from db.tables.application import Application, ApplicationStatus
+from db.tables.vacancy import Vacancy
 from schemas.application import CreateApplicationSchema, UpdateApplicationSchema, OutApplicationSchema, \
     PaginatedApplicationSchema
 
@@ -28,31 +31,76 @@ class ApplicationCrud(BaseCrud[
     def _paginated_schema(self) -> Type[PaginatedApplicationSchema]:
         return PaginatedApplicationSchema
 
-    async def get_applications_by_candidate_id(self, candidate_id: int) -> List[Application]:
-        """Get all applications for a candidate."""
-        query = select(Application).where(Application.candidate_id == candidate_id)
+    async def get_applications_by_candidate_id(
+        self, candidate_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of applications for a candidate.
+
+        Core column select — no ORM instancing; rows feed straight into
+        the response schema.
+        """
+        query = select(*self.out_schema_columns).select_from(Application).where(
+            Application.candidate_id == candidate_id
+        ).order_by(Application.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
-
-    async def get_applications_by_vacancy_id(self, vacancy_id: int) -> List[Application]:
-        """Get all applications for a vacancy."""
-        query = select(Application).where(Application.vacancy_id == vacancy_id)
+        return result.all()
+
+    async def get_applications_by_vacancy_id(
+        self, vacancy_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of applications for a vacancy."""
+        query = select(*self.out_schema_columns).select_from(Application).where(
+            Application.vacancy_id == vacancy_id
+        ).order_by(Application.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
-
-    async def get_pending_applications_by_team(self, team_id: int) -> List[Application]:
-        """Get all pending applications for a team's vacancies."""
-        query = select(Application).join(
-            Application.vacancy
-        ).where(
-            and_(
-                Application.vacancy.has(team_id=team_id),
-                Application.status == ApplicationStatus.PENDING
+        return result.all()
+
+    async def get_pending_applications_by_team(
+        self, team_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Application]:
+        """Get all pending applications for a team's vacancies.
+
+        One join does the filtering and the eager load: contains_eager
+        reuses the joined vacancy rows, so there is no correlated EXISTS
+        and no follow-up selectin query.
+        """
+        query = (
+            select(Application)
+            .join(Vacancy, Application.vacancy)
+            .where(
+                and_(
+                    Vacancy.team_id == team_id,
+                    Application.status == ApplicationStatus.PENDING
+                )
             )
-        ).options(selectinload(Application.vacancy))
+            .options(contains_eager(Application.vacancy), raiseload("*"))
+            .order_by(Application.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
+    async def create_application(self, application_data: dict) -> Optional[Application]:
+        """Insert an application, letting the database reject duplicates.
+
+        ON CONFLICT against the unique (candidate_id, vacancy_id) index
+        replaces the SELECT-then-INSERT dance and its race window with
+        one statement. Returns None when the candidate already applied.
+        """
+        stmt = (
+            pg_insert(Application)
+            .values(**application_data)
+            .on_conflict_do_nothing(index_elements=["candidate_id", "vacancy_id"])
+            .returning(Application)
+        )
+        result = await self._db_session.execute(stmt)
+        application = result.scalar_one_or_none()
+        if application is None:
+            return None
+        await self._db_session.commit()
+        return application
+
     async def check_existing_application(self, candidate_id: int, vacancy_id: int) -> Optional[Application]:
         """Check if candidate already applied to this vacancy."""
         query = select(Application).where(
@@ -60,34 +108,37 @@ class ApplicationCrud(BaseCrud[
                 Application.candidate_id == candidate_id,
                 Application.vacancy_id == vacancy_id
             )
-        )
+        ).options(raiseload("*"))
         result = await self._db_session.execute(query)
         return result.scalars().first()
 
     async def update_application_status(self, application_id: int, new_status: str) -> Application:
-        # Fetch the ORM model instance
-        result = await self._db_session.execute(
-            select(Application).where(Application.id == application_id)
+        """Set an application's status with a single UPDATE…RETURNING."""
+        stmt = (
+            update(Application)
+            .where(Application.id == application_id)
+            .values(status=new_status)
+            .returning(Application)
+            .execution_options(synchronize_session=False)
         )
+        result = await self._db_session.execute(stmt)
         application = result.scalar_one_or_none()
 
         if not application:
             raise HTTPException(status_code=404, detail="Application not found")
 
-        # Update the value
-        application.status = new_status
         await self._db_session.commit()
-        await self._db_session.refresh(application)
-
         return application
 
-    async def get_accepted_applications_by_candidate(self, candidate_id: int) -> List[Application]:
-        """Get all accepted applications for a candidate."""
-        query = select(Application).where(
+    async def get_accepted_applications_by_candidate(
+        self, candidate_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of accepted applications for a candidate."""
+        query = select(*self.out_schema_columns).select_from(Application).where(
             and_(
                 Application.candidate_id == candidate_id,
                 Application.status == ApplicationStatus.ACCEPTED
             )
-        )
+        ).order_by(Application.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.all()
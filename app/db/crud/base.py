@@ -1,9 +1,9 @@
 import abc
 import logging
-from typing import Generic, TypeVar, Type
+from typing import Generic, Optional, TypeVar, Type
 from fastapi import HTTPException
 
-from sqlalchemy import func, column, ColumnClause, update, delete
+from sqlalchemy import func, insert, update, delete
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import UnaryExpression
@@ -67,8 +67,10 @@ class BaseCrud(
         ...
 
     @property
-    def out_schema_columns(self) -> list[ColumnClause]:
-        return [column(i) for i in self._out_schema.model_fields.keys()]
+    def out_schema_columns(self) -> list[InstrumentedAttribute]:
+        # Typed mapper columns rather than bare column() clauses, so the
+        # column types (enum lookup, NaiveUTCDateTime) process Core rows too
+        return [getattr(self._table, i) for i in self._out_schema.model_fields.keys()]
 
     async def create(self, in_schema: IN_SCHEMA) -> OUT_SCHEMA:
         # Handle both Pydantic models and dictionaries
@@ -78,7 +80,24 @@ class BaseCrud(
             entry = self._table(**in_schema.model_dump())
         self._db_session.add(entry)
         await self._db_session.flush()
-        return self._out_schema.model_validate(entry)
+        # Flushed ORM entry — trusted, so skip the validation descent
+        return self._out_schema.from_orm_trusted(entry)
+
+    async def bulk_create(self, items: list[dict]) -> list[int]:
+        """Insert many rows in one round-trip, returning the new ids.
+
+        SQLAlchemy batches the VALUES (insertmanyvalues), so N rows cost one
+        statement instead of N INSERTs. For very large offline imports,
+        asyncpg's copy_records_to_table is still the faster tool.
+        """
+        if not items:
+            return []
+        result = await self._db_session.execute(
+            insert(self._table).returning(self._table.id), items
+        )
+        new_ids = [row_id for (row_id,) in result.all()]
+        await self._db_session.flush()
+        return new_ids
 
     async def get_by_id(self, entry_id, active_only=True) -> OUT_SCHEMA:
         result = await self._db_session.execute(
@@ -92,20 +111,62 @@ class BaseCrud(
         entry = result.first()
         if not entry:
             raise HTTPException(status_code=404, detail="Object not found")
-        return self._out_schema.model_validate(entry)
+        return self._out_schema.from_orm_trusted(entry)
+
+    async def get_many_by_ids(self, ids: list[int], active_only=True) -> dict[int, TABLE]:
+        """Fetch several rows with one IN (...) query, keyed by id.
+
+        Missing ids are simply absent from the result — callers that need
+        a 404 per id can diff the keys against their input.
+        """
+        if not ids:
+            return {}
+        result = await self._db_session.execute(
+            self.apply_active_statement(
+                select(self._table).where(self._table.id.in_(ids)), active_only
+            )
+        )
+        return {entry.id: entry for entry in result.scalars()}
+
+    async def bulk_update_status(self, ids: list[int], status) -> list[int]:
+        """Set status on several rows with one UPDATE, returning touched ids."""
+        if not ids:
+            return []
+        result = await self._db_session.execute(
+            update(self._table)
+            .where(self._table.id.in_(ids))
+            .values(status=status)
+            .returning(self._table.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = [row_id for (row_id,) in result.all()]
+        await self._db_session.flush()
+        return updated_ids
 
     async def update_by_id(
         self, entry_id, in_data: PARTIAL_UPDATE_SCHEMA, active_only=True, raise_404=True
-    ) -> None:
+    ) -> Optional[TABLE]:
+        """Update a row and return it with one UPDATE…RETURNING round-trip."""
+        # Handle both Pydantic models and dictionaries
+        if isinstance(in_data, dict):
+            values = in_data
+        else:
+            values = in_data.model_dump(exclude_unset=True)
         result = await self._db_session.execute(
             self.apply_active_statement(
                 update(self._table).where(self._table.id == entry_id), active_only
-            ).values(**in_data.model_dump(exclude_unset=True))
+            )
+            .values(**values)
+            .returning(self._table)
+            .execution_options(synchronize_session=False)
         )
-        if result.rowcount == 0 and raise_404:
-            raise HTTPException(status_code=404, detail="Object not found")
+        entry = result.scalar_one_or_none()
+        if entry is None:
+            if raise_404:
+                raise HTTPException(status_code=404, detail="Object not found")
+            return None
         await self._db_session.flush()
-        return
+        return entry
 
     async def delete_by_id(self, entry_id, permanently=False, raise_404=True) -> None:
         stmt = delete(self._table).where(self._table.id == entry_id)
@@ -146,5 +207,5 @@ class BaseCrud(
         )
         return self._paginated_schema(
             total=total_count.scalar(),
-            items=[self._out_schema.model_validate(entry) for entry in entries],
+            items=[self._out_schema.from_orm_trusted(entry) for entry in entries],
         )
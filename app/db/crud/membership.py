@@ -1,8 +1,8 @@
+import logging
 from typing import Optional, Type
-from datetime import datetime
 
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload, InstrumentedAttribute
+from sqlalchemy import select, and_, func, update
+from sqlalchemy.orm import selectinload, raiseload, InstrumentedAttribute
 
 from db.crud.base import BaseCrud
 from db.tables.membership import Membership, MembershipStatus
@@ -10,6 +10,9 @@ from schemas.membership import CreateMembershipSchema, UpdateMembershipSchema, O
     PaginatedMembershipSchema
 
 
+logger = logging.getLogger(__name__)
+
+
 class MembershipCrud(BaseCrud[
                          CreateMembershipSchema, UpdateMembershipSchema, OutMembershipSchema, PaginatedMembershipSchema, Membership]):
     @property
@@ -35,46 +38,69 @@ class MembershipCrud(BaseCrud[
                 Membership.user_id == user_id,
                 Membership.status == MembershipStatus.ACTIVE
             )
-        )
+        ).options(raiseload("*"))
         result = await self._db_session.execute(query)
         return result.scalars().first()
 
-    async def get_memberships_by_user_id(self, user_id: int) -> list[Membership]:
-        """Get all memberships for a user."""
-        query = select(Membership).where(Membership.user_id == user_id)
+    async def get_memberships_by_user_id(
+        self,
+        user_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> list[Membership]:
+        """Get a page of a user's memberships, newest first."""
+        query = select(Membership).where(Membership.user_id == user_id).options(raiseload("*"))
+        if before_id is not None:
+            query = query.where(Membership.id < before_id)
+        query = query.order_by(Membership.id.desc()).limit(limit)
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
-    async def get_expired_memberships(self) -> list[Membership]:
-        """Get all expired memberships."""
+    async def get_expired_memberships(self, batch_size: int = 1000):
+        """Stream expired-but-active memberships in batches.
+
+        Renewal sweep: yields lists of up to batch_size rows so the whole
+        backlog never sits in memory at once.
+        """
+        # Cutoff is evaluated server-side; renewal_date is tz-naive UTC, so
+        # now() is normalized to UTC rather than the server timezone
         query = select(Membership).where(
             and_(
                 Membership.status == MembershipStatus.ACTIVE,
-                Membership.renewal_date < datetime.utcnow()
+                Membership.renewal_date < func.timezone("utc", func.now())
             )
-        )
-        result = await self._db_session.execute(query)
-        return result.scalars().all()
+        ).options(raiseload("*")).execution_options(yield_per=batch_size)
+        result = await self._db_session.stream_scalars(query)
+        async for partition in result.partitions(batch_size):
+            yield list(partition)
 
     async def update_membership_status(self, membership_id: int, status: MembershipStatus) -> Optional[Membership]:
-        """Update membership status."""
-        membership = await self.get_by_id(membership_id)
-        if membership:
-            membership.status = status
-            await self._db_session.commit()
-            await self._db_session.refresh(membership)
+        """Update membership status with a single UPDATE…RETURNING."""
+        stmt = (
+            update(Membership)
+            .where(Membership.id == membership_id)
+            .values(status=status)
+            .returning(Membership)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db_session.execute(stmt)
+        membership = result.scalar_one_or_none()
+        if membership is None:
+            return None
+        await self._db_session.commit()
         return membership
 
     async def create_membership(self, membership_data: dict):
         """Create a new membership."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating membership: %s", membership_data)
         try:
-            print("!!!!!! DEBUG: Data before creating membership:", membership_data)
             membership = Membership(**membership_data)
             self._db_session.add(membership)
             await self._db_session.commit()
             await self._db_session.refresh(membership)
             return "ok"
-        except Exception as e:
+        except Exception:
             await self._db_session.rollback()
-            print("!!!!! ERROR inserting membership:", e)
+            logger.exception("Failed to insert membership")
             raise
@@ -1,7 +1,8 @@
 from typing import Optional, List, Type
 
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.orm import selectinload, InstrumentedAttribute
+from sqlalchemy import select, and_, or_, func, update, column, case
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import selectinload, raiseload, InstrumentedAttribute
 
 from db.crud.base import BaseCrud
 from db.tables.message import Message
@@ -25,16 +26,22 @@ class MessageCrud(BaseCrud[CreateMessageSchema, UpdateMessageSchema, OutMessageS
     @property
     def _paginated_schema(self) -> Type[PaginatedMessageSchema]:
         return PaginatedMessageSchema
-    async def get_messages_by_user_id(self, user_id: int) -> List[Message]:
-        """Get all messages for a user (sent and received)."""
-        query = select(Message).where(
+    async def get_messages_by_user_id(
+        self, user_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of messages for a user (sent and received).
+
+        Core column select — no ORM instancing; rows feed straight into
+        the response schema.
+        """
+        query = select(*self.out_schema_columns).select_from(Message).where(
             or_(
                 Message.sender_id == user_id,
                 Message.receiver_id == user_id
             )
-        ).order_by(Message.created_at.desc())
+        ).order_by(Message.created_at.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_conversation(self, user1_id: int, user2_id: int) -> List[Message]:
         """Get conversation between two users."""
@@ -43,77 +50,176 @@ class MessageCrud(BaseCrud[CreateMessageSchema, UpdateMessageSchema, OutMessageS
                 and_(Message.sender_id == user1_id, Message.receiver_id == user2_id),
                 and_(Message.sender_id == user2_id, Message.receiver_id == user1_id)
             )
-        ).order_by(Message.created_at.asc())
+        ).options(raiseload("*")).order_by(Message.created_at.asc())
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
-    async def get_unread_messages(self, user_id: int) -> List[Message]:
-        """Get all unread messages for a user."""
-        query = select(Message).where(
+    async def get_conversation_and_mark_read(
+        self,
+        user_id: int,
+        other_user_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ):
+        """Get a page of a conversation, marking unread messages read, in one round-trip.
+
+        Keyset-paginated: pass the smallest id from the previous page as
+        before_id to fetch the next (older) page. Newest messages first.
+        """
+        updated = (
+            update(Message)
+            .where(
+                and_(
+                    Message.sender_id == other_user_id,
+                    Message.receiver_id == user_id,
+                    Message.is_read == False
+                )
+            )
+            .values(is_read=True)
+            .returning(Message)
+            .cte("updated")
+        )
+        # The outer SELECT sees the pre-update snapshot, so the rows touched
+        # by the CTE come back through its RETURNING and everything else is
+        # read from the table directly
+        remainder = select(Message.__table__).where(
+            or_(
+                and_(Message.sender_id == user_id, Message.receiver_id == other_user_id),
+                and_(
+                    Message.sender_id == other_user_id,
+                    Message.receiver_id == user_id,
+                    Message.is_read == True
+                )
+            )
+        )
+        page = select(updated)
+        if before_id is not None:
+            page = page.where(updated.c.id < before_id)
+            remainder = remainder.where(Message.id < before_id)
+        query = page.union_all(remainder).order_by(column("id").desc()).limit(limit)
+        result = await self._db_session.execute(query)
+        rows = result.all()
+        await self._db_session.commit()
+        return rows
+
+    async def get_unread_messages(
+        self, user_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of unread messages for a user."""
+        query = select(*self.out_schema_columns).select_from(Message).where(
             and_(
                 Message.receiver_id == user_id,
                 Message.is_read == False
             )
-        ).order_by(Message.created_at.desc())
+        ).order_by(Message.created_at.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def mark_as_read(self, message_id: int) -> Optional[Message]:
-        """Mark a message as read."""
-        message = await self.get_by_id(message_id)
-        if message:
-            message.is_read = True
-            await self._db_session.commit()
-            await self._db_session.refresh(message)
+        """Mark a message as read with a single UPDATE…RETURNING."""
+        stmt = (
+            update(Message)
+            .where(Message.id == message_id)
+            .values(is_read=True)
+            .returning(Message)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db_session.execute(stmt)
+        message = result.scalar_one_or_none()
+        if message is None:
+            return None
+        await self._db_session.commit()
         return message
 
     async def mark_conversation_as_read(self, user_id: int, other_user_id: int) -> None:
-        """Mark all messages in a conversation as read."""
-        # This would need a direct update query for efficiency
-        unread_messages = await self._db_session.execute(
-            select(Message).where(
+        """Mark all messages in a conversation as read with one bulk UPDATE."""
+        stmt = (
+            update(Message)
+            .where(
                 and_(
                     Message.sender_id == other_user_id,
                     Message.receiver_id == user_id,
                     Message.is_read == False
                 )
             )
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
         )
-        for message in unread_messages.scalars().all():
-            message.is_read = True
+        await self._db_session.execute(stmt)
         await self._db_session.commit()
 
-    async def get_message_threads(self, user_id: int) -> List[MessageThreadSchema]:
-        """Get message threads for a user."""
-        # This is a complex query that would need to be optimized
-        # For now, we'll return a simple implementation
-        query = select(Message).where(
-            or_(
-                Message.sender_id == user_id,
-                Message.receiver_id == user_id
+    async def get_message_threads(self, user_id: int):
+        """Get message threads for a user in a single windowed query.
+
+        DISTINCT ON picks the latest message per counterparty and a grouped
+        LEFT JOIN supplies the unread counts, so thread building happens in
+        the database instead of loading every message into Python.
+        """
+        partner_id = case(
+            (Message.sender_id == user_id, Message.receiver_id),
+            else_=Message.sender_id,
+        ).label("partner_id")
+
+        base = (
+            select(partner_id, Message.content, Message.created_at)
+            .where(
+                or_(
+                    Message.sender_id == user_id,
+                    Message.receiver_id == user_id
+                )
+            )
+            .subquery()
+        )
+        last_msgs = (
+            select(base.c.partner_id, base.c.content, base.c.created_at)
+            .distinct(base.c.partner_id)
+            .order_by(base.c.partner_id, base.c.created_at.desc())
+            .subquery()
+        )
+
+        unread = (
+            select(
+                Message.sender_id.label("partner_id"),
+                func.count().label("unread_count"),
             )
-        ).order_by(Message.created_at.desc())
+            .where(
+                and_(
+                    Message.receiver_id == user_id,
+                    Message.is_read == False
+                )
+            )
+            .group_by(Message.sender_id)
+            .subquery()
+        )
+
+        query = (
+            select(
+                last_msgs.c.partner_id.label("user_id"),
+                (User.first_name + " " + User.last_name).label("user_name"),
+                User.role.label("user_role"),
+                last_msgs.c.content.label("last_message"),
+                last_msgs.c.created_at.label("last_message_time"),
+                func.coalesce(unread.c.unread_count, 0).label("unread_count"),
+            )
+            .join(User, User.id == last_msgs.c.partner_id)
+            .outerjoin(unread, unread.c.partner_id == last_msgs.c.partner_id)
+            .order_by(last_msgs.c.created_at.desc())
+        )
         result = await self._db_session.execute(query)
-        messages = result.scalars().all()
-        
-        # Group messages by conversation partner
-        threads = {}
-        for message in messages:
-            partner_id = message.sender_id if message.receiver_id == user_id else message.receiver_id
-            if partner_id not in threads:
-                threads[partner_id] = {
-                    'user_id': partner_id,
-                    'last_message': message.content,
-                    'last_message_time': message.created_at,
-                    'unread_count': 0
-                }
-            if message.receiver_id == user_id and not message.is_read:
-                threads[partner_id]['unread_count'] += 1
-        
-        return list(threads.values())
-
-    async def get_replies_to_message(self, message_id: int) -> List[Message]:
-        """Get all replies to a message."""
-        query = select(Message).where(Message.parent_message_id == message_id).order_by(Message.created_at.asc())
+        return result.all()
+
+    async def get_replies_to_message(
+        self,
+        message_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> List[Message]:
+        """Get a page of replies to a message, newest first."""
+        query = select(Message).where(
+            Message.parent_message_id == message_id
+        ).options(raiseload("*"))
+        if before_id is not None:
+            query = query.where(Message.id < before_id)
+        query = query.order_by(Message.id.desc()).limit(limit)
         result = await self._db_session.execute(query)
-        return result.scalars().all() 
\ No newline at end of file
+        return result.scalars().all()
\ No newline at end of file
@@ -1,7 +1,8 @@
 from typing import Optional, List, Type
 
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload, InstrumentedAttribute
+from sqlalchemy import select, and_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import selectinload, raiseload, InstrumentedAttribute
 
 from db.crud.base import BaseCrud
 from db.tables.placement import Placement, PlacementStatus
@@ -24,72 +25,96 @@ class PlacementCrud(BaseCrud[CreatePlacementSchema, UpdatePlacementSchema, OutPl
     @property
     def _paginated_schema(self) -> Type[PaginatedPlacementSchema]:
         return PaginatedPlacementSchema
-    async def get_placements_by_team_id(self, team_id: int) -> List[Placement]:
-        """Get all placements for a team."""
-        query = select(Placement).where(Placement.team_id == team_id)
+    async def get_placements_by_team_id(
+        self, team_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of placements for a team.
+
+        Core column select — no ORM instancing; rows feed straight into
+        the response schema.
+        """
+        query = select(*self.out_schema_columns).select_from(Placement).where(
+            Placement.team_id == team_id
+        ).order_by(Placement.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
-    async def get_placements_by_candidate_id(self, candidate_id: int) -> List[Placement]:
-        """Get all placements for a candidate."""
-        query = select(Placement).where(Placement.candidate_id == candidate_id)
+    async def get_placements_by_candidate_id(
+        self, candidate_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of placements for a candidate."""
+        query = select(*self.out_schema_columns).select_from(Placement).where(
+            Placement.candidate_id == candidate_id
+        ).order_by(Placement.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
-    async def get_unpaid_placements_by_team(self, team_id: int) -> List[Placement]:
-        """Get all unpaid placements for a team."""
-        query = select(Placement).where(
+    async def get_unpaid_placements_by_team(
+        self, team_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Row]:
+        """Get a page of unpaid placements for a team."""
+        query = select(*self.out_schema_columns).select_from(Placement).where(
             and_(
                 Placement.team_id == team_id,
                 Placement.invoice_generated == True,
                 Placement.invoice_paid == False
             )
-        )
+        ).order_by(Placement.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_placement_by_application_id(self, application_id: int) -> Optional[Placement]:
         """Get placement by application ID."""
-        query = select(Placement).where(Placement.application_id == application_id)
+        query = select(Placement).where(
+            Placement.application_id == application_id
+        ).options(raiseload("*"))
         result = await self._db_session.execute(query)
         return result.scalars().first()
 
+    async def _update_returning(self, placement_id: int, **values) -> Optional[Placement]:
+        """Apply values with one UPDATE…RETURNING instead of SELECT+refresh."""
+        stmt = (
+            update(Placement)
+            .where(Placement.id == placement_id)
+            .values(**values)
+            .returning(Placement)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db_session.execute(stmt)
+        placement = result.scalar_one_or_none()
+        if placement is None:
+            return None
+        await self._db_session.commit()
+        return placement
+
     async def confirm_placement(self, placement_id: int) -> Optional[Placement]:
         """Confirm a placement."""
-        placement = await self.get_by_id(placement_id)
-        if placement:
-            placement.status = PlacementStatus.CONFIRMED
-            await self._db_session.commit()
-            await self._db_session.refresh(placement)
-        return placement
+        return await self._update_returning(placement_id, status=PlacementStatus.CONFIRMED)
 
     async def mark_invoice_generated(self, placement_id: int, pdf_path: str) -> Optional[Placement]:
         """Mark invoice as generated."""
-        placement = await self.get_by_id(placement_id)
-        if placement:
-            placement.invoice_generated = True
-            placement.invoice_pdf_path = pdf_path
-            await self._db_session.commit()
-            await self._db_session.refresh(placement)
-        return placement
+        return await self._update_returning(
+            placement_id, invoice_generated=True, invoice_pdf_path=pdf_path
+        )
 
     async def mark_invoice_paid(self, placement_id: int) -> Optional[Placement]:
         """Mark invoice as paid."""
-        placement = await self.get_by_id(placement_id)
-        if placement:
-            placement.invoice_paid = True
-            placement.status = PlacementStatus.COMPLETED
-            await self._db_session.commit()
-            await self._db_session.refresh(placement)
-        return placement
+        return await self._update_returning(
+            placement_id, invoice_paid=True, status=PlacementStatus.COMPLETED
+        )
 
-    async def get_pending_invoices(self) -> List[Placement]:
-        """Get all placements with pending invoice generation."""
+    async def get_pending_invoices(self, batch_size: int = 1000):
+        """Stream placements with pending invoice generation in batches.
+
+        Admin sweep: yields lists of up to batch_size rows so the whole
+        backlog never sits in memory at once.
+        """
         query = select(Placement).where(
             and_(
                 Placement.status == PlacementStatus.CONFIRMED,
                 Placement.invoice_generated == False
             )
-        )
-        result = await self._db_session.execute(query)
-        return result.scalars().all() 
\ No newline at end of file
+        ).options(raiseload("*")).execution_options(yield_per=batch_size)
+        result = await self._db_session.stream_scalars(query)
+        async for partition in result.partitions(batch_size):
+            yield list(partition)
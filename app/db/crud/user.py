@@ -1,11 +1,12 @@
 from typing import Type, Optional, List
+from datetime import datetime
 
-from pydantic import EmailStr
 from sqlalchemy.sql.elements import UnaryExpression
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, or_, func, lambda_stmt, text, update
+from sqlalchemy.orm import selectinload, contains_eager, raiseload, aliased
 
 from db.crud.base import BaseCrud
+from db.tables.membership import Membership, MembershipStatus
 from db.tables.user import User as UserTable, UserRole
 from schemas.user import (
     UpdateUserSchema,
@@ -48,16 +49,63 @@ class UsersCrud(
         )
         return result.scalar_one_or_none()
 
+    async def get_with_active_membership(self, user_id: int) -> tuple[Optional[UserTable], bool]:
+        """Get a user and an active-membership flag in a single query."""
+        has_active_membership = (
+            select(Membership.id)
+            .where(
+                Membership.user_id == user_id,
+                Membership.status == MembershipStatus.ACTIVE
+            )
+            .exists()
+        )
+        result = await self._db_session.execute(
+            select(UserTable, has_active_membership.label("has_active_membership")).where(
+                UserTable.id == user_id, UserTable.deleted_at.is_(None)
+            )
+        )
+        row = result.first()
+        if not row:
+            return None, False
+        return row[0], row[1]
+
+    async def clear_cv_path(self, user_id: int) -> Optional[str]:
+        """Clear a user's CV path and return the old path in one round-trip.
+
+        Joins the row against itself because a plain RETURNING would give
+        the post-update (NULL) value on PostgreSQL.
+        """
+        old = aliased(UserTable)
+        stmt = (
+            update(UserTable)
+            .where(
+                UserTable.id == user_id,
+                UserTable.id == old.id,
+                UserTable.deleted_at.is_(None)
+            )
+            .values(cv_file_path=None)
+            .returning(old.cv_file_path)
+        )
+        result = await self._db_session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_active_candidate_by_id(self, user_id: int) -> Optional[UserTable]:
+        """Get an active candidate by id, with role/active filtered in SQL."""
+        query = select(UserTable).where(
+            and_(
+                UserTable.id == user_id,
+                UserTable.role == UserRole.CANDIDATE,
+                UserTable.is_active == True
+            )
+        )
+        result = await self._db_session.execute(query)
+        return result.scalar_one_or_none()
+
     async def get_by_email(self, email: str) -> Optional[UserTable]:
         """Get user by email."""
-        try:
-            stmt = select(self._table).where(self._table.email == email)
-            result = await self._db_session.execute(stmt)
-            user = result.scalar_one_or_none()
-            return user
-        except Exception as e:
-            print(f"Error in get_by_email: {str(e)}")
-            return None
+        stmt = select(self._table).where(self._table.email == email)
+        result = await self._db_session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def get_candidates(self, limit: int = 20, offset: int = 0) -> List[UserTable]:
         """Get all candidates."""
@@ -66,7 +114,7 @@ class UsersCrud(
                 UserTable.role == UserRole.CANDIDATE,
                 UserTable.is_active == True
             )
-        ).limit(limit).offset(offset)
+        ).options(raiseload("*")).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
@@ -77,7 +125,7 @@ class UsersCrud(
                 UserTable.role == UserRole.TEAM,
                 UserTable.is_active == True
             )
-        ).limit(limit).offset(offset)
+        ).options(raiseload("*")).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
@@ -88,14 +136,47 @@ class UsersCrud(
                 UserTable.role == UserRole.TEAM,
                 UserTable.is_approved == False
             )
-        )
+        ).options(raiseload("*"))
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
     async def search_candidates(self, search_params: CandidateSearchSchema, limit: int = 20, offset: int = 0) -> List[
         UserTable]:
         """Search candidates with filters."""
-        query = select(UserTable).where(
+        # lambda_stmt lets SQLAlchemy cache the compiled SQL per filter shape,
+        # so repeated calls with the same set of filters skip the compile step
+        query = lambda_stmt(
+            lambda: select(UserTable).where(
+                and_(
+                    UserTable.role == UserRole.CANDIDATE,
+                    UserTable.is_active == True
+                )
+            )
+        )
+
+        if search_params.role:
+            role_pattern = f"%{search_params.role}%"
+            query += lambda s: s.where(UserTable.position.ilike(role_pattern))
+
+        if search_params.location:
+            location_pattern = f"%{search_params.location}%"
+            query += lambda s: s.where(UserTable.location.ilike(location_pattern))
+
+        if search_params.experience_level:
+            experience_level = search_params.experience_level
+            query += lambda s: s.where(UserTable.experience_level == experience_level)
+
+        if search_params.position:
+            position_pattern = f"%{search_params.position}%"
+            query += lambda s: s.where(UserTable.position.ilike(position_pattern))
+
+        query += lambda s: s.limit(limit).offset(offset)
+        result = await self._db_session.execute(query)
+        return result.scalars().all()
+
+    async def latest_candidate_mtime(self, search_params: CandidateSearchSchema) -> Optional[datetime]:
+        """Get the most recent updated_at across candidates matching the filters."""
+        query = select(func.max(UserTable.updated_at)).where(
             and_(
                 UserTable.role == UserRole.CANDIDATE,
                 UserTable.is_active == True
@@ -114,72 +195,97 @@ class UsersCrud(
         if search_params.position:
             query = query.where(UserTable.position.ilike(f"%{search_params.position}%"))
 
-        query = query.limit(limit).offset(offset)
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.scalar()
 
-    async def approve_team(self, team_id: int) -> Optional[UserTable]:
-        """Approve a team."""
-        # Get the actual database object, not the Pydantic model
-        stmt = select(self._table).where(self._table.id == team_id)
+    async def _set_flags(self, user_id: int, extra_where=None, **values) -> Optional[UserTable]:
+        """Flip user flags with one UPDATE…RETURNING instead of SELECT+refresh."""
+        conditions = [self._table.id == user_id]
+        if extra_where is not None:
+            conditions.append(extra_where)
+        stmt = (
+            update(self._table)
+            .where(*conditions)
+            .values(**values)
+            .returning(self._table)
+            .execution_options(synchronize_session=False)
+        )
         result = await self._db_session.execute(stmt)
-        team = result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+        if user is None:
+            return None
+        await self._db_session.commit()
+        return user
 
-        if team and team.role == UserRole.TEAM:
-            team.is_approved = True
-            await self._db_session.commit()
-            await self._db_session.refresh(team)
-            return team
-        return None
+    async def approve_team(self, team_id: int) -> Optional[UserTable]:
+        """Approve a team."""
+        return await self._set_flags(
+            team_id, extra_where=self._table.role == UserRole.TEAM, is_approved=True
+        )
 
     async def activate_user(self, user_id: int) -> Optional[UserTable]:
         """Activate a user."""
-        # Get the actual database object, not the Pydantic model
-        stmt = select(self._table).where(self._table.id == user_id)
-        result = await self._db_session.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if user:
-            user.is_active = True
-            await self._db_session.commit()
-            await self._db_session.refresh(user)
-            return user
-        return None
+        return await self._set_flags(user_id, is_active=True)
 
     async def deactivate_user(self, user_id: int) -> Optional[UserTable]:
         """Deactivate a user."""
-        # Get the actual database object, not the Pydantic model
-        stmt = select(self._table).where(self._table.id == user_id)
-        result = await self._db_session.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if user:
-            user.is_active = False
-            await self._db_session.commit()
-            await self._db_session.refresh(user)
-            return user
-        return None
+        return await self._set_flags(user_id, is_active=False)
 
     async def get_candidates_with_active_membership(self) -> List[UserTable]:
-        """Get candidates with active membership."""
-        query = select(UserTable).join(
-            UserTable.memberships
-        ).where(
-            and_(
-                UserTable.role == UserRole.CANDIDATE,
-                UserTable.is_active == True,
-                UserTable.memberships.any(status="active")
+        """Get candidates with active membership.
+
+        A single join carries both the filter and the eager load:
+        contains_eager maps the joined membership rows back onto each
+        candidate, so there is no EXISTS subquery and no second
+        selectin round-trip.
+        """
+        query = (
+            select(UserTable)
+            .join(
+                Membership,
+                and_(
+                    Membership.user_id == UserTable.id,
+                    Membership.status == MembershipStatus.ACTIVE
+                )
+            )
+            .where(
+                and_(
+                    UserTable.role == UserRole.CANDIDATE,
+                    UserTable.is_active == True
+                )
             )
-        ).options(selectinload(UserTable.memberships))
+            .options(contains_eager(UserTable.memberships), raiseload("*"))
+        )
         result = await self._db_session.execute(query)
-        return result.scalars().all()
+        return result.unique().scalars().all()
 
     async def get_all(self, limit: int, offset: int):
         stmt = select(UserTable).limit(limit).offset(offset)
         result = await self._db_session.execute(stmt)
         return result.scalars().all()
 
-    async def count(self):
-        stmt = select(func.count()).select_from(UserTable)
-        result = await self._db_session.execute(stmt)
-        return result.scalar_one()
+    async def count(self, exact: bool = False):
+        """Count users, using the planner's row estimate by default.
+
+        SELECT count(*) scans the whole table; pg_class.reltuples is kept
+        current by autovacuum and is close enough for pagination totals and
+        dashboard stats. Pass exact=True where the precise number matters.
+        """
+        if exact:
+            stmt = select(func.count()).select_from(UserTable)
+            result = await self._db_session.execute(stmt)
+            return result.scalar_one()
+
+        # CAST(... AS regclass) rather than ::regclass — text() doesn't
+        # recognize a bound parameter immediately followed by a :: cast
+        estimate_stmt = text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = CAST(:table AS regclass)"
+        ).bindparams(table=UserTable.__tablename__)
+        result = await self._db_session.execute(estimate_stmt)
+        estimate = result.scalar_one()
+        # A table that has never been analyzed reports -1 (or 0 while still
+        # tiny) — fall back to the exact count rather than lying
+        if estimate < 1:
+            return await self.count(exact=True)
+        return estimate
@@ -1,16 +1,99 @@
+from functools import lru_cache
 from typing import Optional, List, Type, Any, Coroutine
 from datetime import datetime
 
-from fastapi import HTTPException
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.orm import selectinload, InstrumentedAttribute, joinedload
+from sqlalchemy import bindparam, select, and_, or_, func, insert, tuple_, update
+from sqlalchemy.orm import raiseload, InstrumentedAttribute, joinedload
 
 from db.crud.base import BaseCrud
+from db.tables.user import User
 from db.tables.vacancy import Vacancy, VacancyStatus
 from schemas.vacancy import CreateVacancySchema, UpdateVacancySchema, VacancySearchSchema, OutVacancySchema, \
     PaginatedVacancySchema
 
 
+# Flat column select for the list view: the description/requirements
+# Text blobs never leave the database, the team name arrives via the
+# join (no eager-loaded User instance), and no ORM objects are
+# materialized per row — the Row tuples feed the response schema directly
+_SEARCH_COLUMNS = (
+    Vacancy.id,
+    Vacancy.title,
+    Vacancy.location,
+    Vacancy.position_type,
+    Vacancy.experience_level,
+    Vacancy.expiry_date,
+    Vacancy.salary_min,
+    Vacancy.salary_max,
+    Vacancy.status,
+    Vacancy.team_id,
+    User.club_name.label("team_name"),
+    Vacancy.created_at,
+    Vacancy.updated_at,
+)
+
+_SEARCH_ORDERING = (Vacancy.created_at.desc(), Vacancy.id.desc())
+
+
+def _search_filters(key: tuple[bool, ...]) -> list:
+    """Build the WHERE clauses for a filter-presence key with bindparams.
+
+    Substring matches go through lower()/LIKE so they hit the trigram
+    indexes on lower(<column>).
+    """
+    has_role, has_location, has_salary_min, has_salary_max, has_experience, has_position = key
+    filters = [Vacancy.deleted_at.is_(None)]
+    if has_role:
+        filters.append(func.lower(Vacancy.title).like(bindparam("role")))
+    if has_location:
+        filters.append(func.lower(Vacancy.location).like(bindparam("location")))
+    if has_salary_min:
+        filters.append(Vacancy.salary_min >= bindparam("salary_min"))
+    if has_salary_max:
+        filters.append(Vacancy.salary_max <= bindparam("salary_max"))
+    if has_experience:
+        filters.append(func.lower(Vacancy.experience_level).like(bindparam("experience_level")))
+    if has_position:
+        filters.append(func.lower(Vacancy.position_type).like(bindparam("position_type")))
+    return filters
+
+
+# The filter shape changes far less often than the values, so the Select
+# trees are built once per shape and reused with fresh bind values
+
+
+@lru_cache(maxsize=None)
+def _search_keyset_stmt(key: tuple[bool, ...]):
+    return (
+        select(*_SEARCH_COLUMNS)
+        .join(User, Vacancy.team_id == User.id)
+        .where(
+            *_search_filters(key),
+            tuple_(Vacancy.created_at, Vacancy.id)
+            < tuple_(bindparam("cursor_created_at"), bindparam("cursor_id")),
+        )
+        .order_by(*_SEARCH_ORDERING)
+        .limit(bindparam("limit"))
+    )
+
+
+@lru_cache(maxsize=None)
+def _search_offset_stmt(key: tuple[bool, ...]):
+    return (
+        select(*_SEARCH_COLUMNS, func.count().over().label("total"))
+        .join(User, Vacancy.team_id == User.id)
+        .where(*_search_filters(key))
+        .order_by(*_SEARCH_ORDERING)
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
+
+@lru_cache(maxsize=None)
+def _search_count_stmt(key: tuple[bool, ...]):
+    return select(func.count()).select_from(Vacancy).where(*_search_filters(key))
+
+
 class VacancyCrud(
     BaseCrud[CreateVacancySchema, UpdateVacancySchema, OutVacancySchema, PaginatedVacancySchema, Vacancy]):
     @property
@@ -29,102 +112,200 @@ class VacancyCrud(
     def _paginated_schema(self) -> Type[PaginatedVacancySchema]:
         return PaginatedVacancySchema
 
-    async def get_active_vacancies(self, team_id: int) -> List[Vacancy]:
-        """Get all active vacancies for a specific team."""
+    async def get_active_vacancies(
+        self, team_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Vacancy]:
+        """Get a page of active vacancies for a specific team."""
         query = select(Vacancy).where(
             and_(
                 Vacancy.status == VacancyStatus.ACTIVE,
                 Vacancy.team_id == team_id,
                 Vacancy.deleted_at.is_(None)  # Exclude soft-deleted vacancies
             )
-        )
-        print(f"Executing query: {query}")
+        ).options(raiseload("*")).order_by(Vacancy.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
-    async def get_vacancies_by_team_id(self, team_id: int) -> List[Vacancy]:
-        """Get all vacancies for a team."""
-        query = select(Vacancy).where(Vacancy.team_id == team_id)
+    async def get_vacancies_by_team_id(
+        self, team_id: int, limit: int = 100, offset: int = 0
+    ) -> List[Vacancy]:
+        """Get a page of a team's vacancies."""
+        query = select(Vacancy).where(
+            Vacancy.team_id == team_id
+        ).options(raiseload("*")).order_by(Vacancy.id.desc()).limit(limit).offset(offset)
         result = await self._db_session.execute(query)
         return result.scalars().all()
 
+    async def iter_vacancies_by_team(self, team_id: int, batch_size: int = 500):
+        """Stream every vacancy of a team in batches.
+
+        Export paths: yields lists of up to batch_size rows from a
+        server-side cursor, so memory stays O(batch_size) however many
+        vacancies the team has.
+        """
+        query = select(Vacancy).where(
+            Vacancy.team_id == team_id
+        ).order_by(Vacancy.id).execution_options(yield_per=batch_size)
+        result = await self._db_session.stream_scalars(query)
+        async for partition in result.partitions(batch_size):
+            yield list(partition)
+
     async def search_vacancies(
         self,
         params: VacancySearchSchema,
         limit: int,
-        offset: int
+        offset: int = 0,
+        cursor: Optional[tuple[datetime, int]] = None
     ):
-        # Build base filters
-        filters = [self._table.deleted_at.is_(None)]
-
+        # Statements are cached per filter shape; only the bind values
+        # change between calls
+        key = (
+            bool(params.role),
+            bool(params.location),
+            params.salary_min is not None,
+            params.salary_max is not None,
+            bool(params.experience_level),
+            bool(params.position_type),
+        )
+        values: dict[str, Any] = {"limit": limit}
         if params.role:
-            filters.append(self._table.role.ilike(f"%{params.role}%"))
+            values["role"] = f"%{params.role.lower()}%"
         if params.location:
-            filters.append(self._table.location.ilike(f"%{params.location}%"))
+            values["location"] = f"%{params.location.lower()}%"
         if params.salary_min is not None:
-            filters.append(self._table.salary_min >= params.salary_min)
+            values["salary_min"] = params.salary_min
         if params.salary_max is not None:
-            filters.append(self._table.salary_max <= params.salary_max)
+            values["salary_max"] = params.salary_max
         if params.experience_level:
-            filters.append(self._table.experience_level.ilike(f"%{params.experience_level}%"))
+            values["experience_level"] = f"%{params.experience_level.lower()}%"
         if params.position_type:
-            filters.append(self._table.position_type.ilike(f"%{params.position_type}%"))
-
-        # Count total without joinedload
-        count_query = select(func.count()).select_from(self._table).where(*filters)
-        total_count_result = await self._db_session.execute(count_query)
-        total_count = total_count_result.scalar_one()
-
-        # Main query with team join
-        paginated_query = (
-            select(self._table)
-            .options(joinedload(self._table.team))
-            .where(*filters)
-            .limit(limit)
-            .offset(offset)
-        )
-        result = await self._db_session.execute(paginated_query)
-        vacancies = result.scalars().all()
+            values["position_type"] = f"%{params.position_type.lower()}%"
 
-        return vacancies, total_count
+        if cursor is not None:
+            # Keyset page: the row-value comparison seeks straight to the
+            # cursor position, so cost stays flat however deep the client
+            # paginates, and no COUNT is run
+            values["cursor_created_at"], values["cursor_id"] = cursor
+            result = await self._db_session.execute(_search_keyset_stmt(key), values)
+            return result.all(), None
 
-    async def get_expired_vacancies(self) -> List[Vacancy]:
-        """Get all expired vacancies."""
-        query = select(Vacancy).where(
+        # Offset page: fetch the page and the total in one round-trip —
+        # COUNT(*) OVER() is evaluated before LIMIT/OFFSET, so every row
+        # carries the real match count and the separate count query is gone
+        values["offset"] = offset
+        result = await self._db_session.execute(_search_offset_stmt(key), values)
+        rows = result.all()
+
+        if rows:
+            # The trailing "total" column rides along on each Row; the
+            # response schema only reads its declared fields
+            return rows, rows[0].total
+
+        if offset == 0:
+            return [], 0
+
+        # Page beyond the last result — fall back to a plain count so the
+        # total stays correct
+        for extra in ("limit", "offset"):
+            values.pop(extra)
+        total_count = (
+            await self._db_session.execute(_search_count_stmt(key), values)
+        ).scalar_one()
+        return [], total_count
+
+    async def get_vacancy_status_buckets(self, team_id: int) -> dict[str, int]:
+        """Count a team's live and expired active vacancies in one query.
+
+        Conditional aggregates split the counts in a single index pass
+        instead of two round-trips walking the same rows.
+        """
+        now_utc = func.timezone("utc", func.now())
+        query = select(
+            func.count().filter(Vacancy.expiry_date >= now_utc).label("active"),
+            func.count().filter(Vacancy.expiry_date < now_utc).label("expired"),
+        ).where(
             and_(
                 Vacancy.status == VacancyStatus.ACTIVE,
-                Vacancy.expiry_date < datetime.utcnow()
+                Vacancy.team_id == team_id,
+                Vacancy.deleted_at.is_(None)
             )
         )
-        result = await self._db_session.execute(query)
-        return result.scalars().all()
+        row = (await self._db_session.execute(query)).one()
+        return {"active": row.active, "expired": row.expired}
 
-    async def close_vacancy(self, vacancy_id: int) -> OutVacancySchema:
-        """Close a vacancy."""
-        # Fetch the ORM model
-        vacancy = await self._db_session.get(Vacancy, vacancy_id)
+    async def get_expired_vacancies(self, batch_size: int = 1000):
+        """Stream expired-but-active vacancies in batches.
 
-        if not vacancy:
-            raise HTTPException(
-                status_code=404, detail="Vacancy not found"
+        Expiry sweep: yields lists of up to batch_size rows so the whole
+        backlog never sits in memory at once.
+        """
+        # Cutoff is evaluated server-side; expiry_date is tz-naive UTC, so
+        # now() is normalized to UTC rather than the server timezone
+        query = select(Vacancy).where(
+            and_(
+                Vacancy.status == VacancyStatus.ACTIVE,
+                Vacancy.expiry_date < func.timezone("utc", func.now())
             )
+        ).execution_options(yield_per=batch_size)
+        result = await self._db_session.stream_scalars(query)
+        async for partition in result.partitions(batch_size):
+            yield list(partition)
 
-        # Update the status
-        vacancy.status = VacancyStatus.CLOSED
+    async def close_expired_vacancies(self) -> int:
+        """Close every expired active vacancy with one bulk UPDATE.
 
-        # Commit and refresh to reload the updated instance
+        The whole sweep happens server-side — no rows travel to Python
+        just to be written back one at a time. Returns how many
+        vacancies were closed.
+        """
+        stmt = (
+            update(Vacancy)
+            .where(
+                and_(
+                    Vacancy.status == VacancyStatus.ACTIVE,
+                    Vacancy.expiry_date < func.timezone("utc", func.now())
+                )
+            )
+            .values(status=VacancyStatus.CLOSED)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._db_session.execute(stmt)
         await self._db_session.commit()
-        await self._db_session.refresh(vacancy)
+        return result.rowcount
 
-        # Convert the ORM model to a Pydantic schema
-        return OutVacancySchema.model_validate(vacancy)
+    async def update_status_owned(
+        self, vacancy_id: int, team_id: int, status: VacancyStatus
+    ) -> Optional[Vacancy]:
+        """Set a vacancy's status with one UPDATE…RETURNING.
+
+        Ownership is enforced in the WHERE clause, so there is no separate
+        SELECT and no window for the row to change between check and write.
+        Returns None when the vacancy doesn't exist or belongs to another
+        team.
+        """
+        query = (
+            update(self._table)
+            .where(self._table.id == vacancy_id, self._table.team_id == team_id)
+            .values(status=status)
+            .returning(self._table)
+        )
+        result = await self._db_session.execute(query)
+        vacancy = result.scalar_one_or_none()
+        if vacancy is None:
+            return None
+        await self._db_session.commit()
+        return vacancy
 
     async def create_vacancy(self, in_schema: CreateVacancySchema, team_id: int) -> Vacancy:
-        """Create a new vacancy associated with a team."""
-        vacancy = self._table(**in_schema.model_dump(), team_id=team_id)
-        self._db_session.add(vacancy)
+        """Create a new vacancy with one INSERT…RETURNING round-trip."""
+        stmt = (
+            insert(self._table)
+            .values(**in_schema.model_dump(), team_id=team_id)
+            .returning(self._table)
+        )
+        result = await self._db_session.execute(stmt)
+        vacancy = result.scalar_one()
         await self._db_session.commit()
-        await self._db_session.refresh(vacancy)
         return vacancy
 
     async def get_by_id_model(self, entry_id: int) -> Optional[Vacancy]:
@@ -136,24 +317,25 @@ class VacancyCrud(
     async def update(
         self, obj_id: int, schema: UpdateVacancySchema, author_id: int
     ) -> Optional[Vacancy]:
-        """Update a vacancy by its ID, with an authorization check."""
-        # Retrieve the SQLAlchemy model instance
-        vacancy_to_update = await self.get_by_id_model(obj_id)
-
-        if not vacancy_to_update:
-            return None  # Vacancy not found
-
-        # Authorization check: only the author can update
-        if vacancy_to_update.team_id != author_id:
-            # For better security, you might want to raise a 403 Forbidden HTTPException here
-            return None
-
-        # Update the model with data from the schema
+        """Update an owned vacancy with one UPDATE…RETURNING round-trip."""
         update_data = schema.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(vacancy_to_update, field, value)
+        if not update_data:
+            # Nothing to write — just return the row if the caller owns it
+            query = select(self._table).where(
+                self._table.id == obj_id, self._table.team_id == author_id
+            )
+            result = await self._db_session.execute(query)
+            return result.scalars().first()
 
+        query = (
+            update(self._table)
+            .where(self._table.id == obj_id, self._table.team_id == author_id)
+            .values(**update_data)
+            .returning(self._table)
+        )
+        result = await self._db_session.execute(query)
+        vacancy = result.scalar_one_or_none()
+        if vacancy is None:
+            return None
         await self._db_session.commit()
-        await self._db_session.refresh(vacancy_to_update)
-
-        return vacancy_to_update
+        return vacancy
@@ -0,0 +1,29 @@
+"""add active candidate partial index
+
+Revision ID: 8c41f7b2d9a3
+Revises: 0feb8178125d
+Create Date: 2025-08-30 10:12:44.102938
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '8c41f7b2d9a3'
+down_revision = '0feb8178125d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_candidate_active',
+        'user',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("role = 'CANDIDATE' AND is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_candidate_active', table_name='user')
@@ -0,0 +1,50 @@
+"""add vacancy trigram search indexes
+
+Revision ID: a7c5e81f2b63
+Revises: f6b9d43a8e52
+Create Date: 2025-08-30 19:05:27.361184
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a7c5e81f2b63'
+down_revision = 'f6b9d43a8e52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_vacancy_title_trgm',
+        'vacancy',
+        [sa.text('lower(title) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_vacancy_location_trgm',
+        'vacancy',
+        [sa.text('lower(location) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_vacancy_experience_trgm',
+        'vacancy',
+        [sa.text('lower(experience_level) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_vacancy_position_trgm',
+        'vacancy',
+        [sa.text('lower(position_type) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vacancy_position_trgm', table_name='vacancy')
+    op.drop_index('ix_vacancy_experience_trgm', table_name='vacancy')
+    op.drop_index('ix_vacancy_location_trgm', table_name='vacancy')
+    op.drop_index('ix_vacancy_title_trgm', table_name='vacancy')
@@ -0,0 +1,28 @@
+"""add message conversation index
+
+Revision ID: b7e62a90f514
+Revises: 8c41f7b2d9a3
+Create Date: 2025-08-30 14:27:10.551203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b7e62a90f514'
+down_revision = '8c41f7b2d9a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_message_conversation',
+        'message',
+        ['sender_id', 'receiver_id', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_message_conversation', table_name='message')
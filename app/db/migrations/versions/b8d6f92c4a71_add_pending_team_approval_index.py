@@ -0,0 +1,28 @@
+"""add pending team approval index
+
+Revision ID: b8d6f92c4a71
+Revises: a7c5e81f2b63
+Create Date: 2025-08-30 19:38:52.117408
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b8d6f92c4a71'
+down_revision = 'a7c5e81f2b63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_team_pending_approval',
+        'user',
+        ['id'],
+        postgresql_where=sa.text("role = 'TEAM' AND NOT is_approved"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_team_pending_approval', table_name='user')
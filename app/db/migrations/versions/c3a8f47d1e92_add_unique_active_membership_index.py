@@ -0,0 +1,29 @@
+"""add unique active membership index
+
+Revision ID: c3a8f47d1e92
+Revises: b7e62a90f514
+Create Date: 2025-08-30 15:02:33.914470
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c3a8f47d1e92'
+down_revision = 'b7e62a90f514'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'uniq_membership_active_user',
+        'membership',
+        ['user_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uniq_membership_active_user', table_name='membership')
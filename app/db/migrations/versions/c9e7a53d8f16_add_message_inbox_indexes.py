@@ -0,0 +1,49 @@
+"""add message inbox indexes
+
+Revision ID: c9e7a53d8f16
+Revises: b8d6f92c4a71
+Create Date: 2025-08-30 19:51:33.902647
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c9e7a53d8f16'
+down_revision = 'b8d6f92c4a71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_message_inbox',
+        'message',
+        ['receiver_id', 'created_at'],
+    )
+    op.create_index(
+        'ix_message_unread_partial',
+        'message',
+        ['receiver_id', 'created_at'],
+        postgresql_where=sa.text('is_read = false'),
+    )
+    op.create_index(
+        'ix_message_thread',
+        'message',
+        ['parent_message_id', 'id'],
+    )
+    # Superseded by ix_message_unread_partial, which adds the created_at
+    # ordering the unread page actually uses
+    op.drop_index('ix_message_receiver_unread', table_name='message')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_message_receiver_unread',
+        'message',
+        ['receiver_id'],
+        postgresql_where=sa.text('is_read = false'),
+    )
+    op.drop_index('ix_message_thread', table_name='message')
+    op.drop_index('ix_message_unread_partial', table_name='message')
+    op.drop_index('ix_message_inbox', table_name='message')
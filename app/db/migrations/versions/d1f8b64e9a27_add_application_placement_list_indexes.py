@@ -0,0 +1,45 @@
+"""add application placement list indexes
+
+Revision ID: d1f8b64e9a27
+Revises: c9e7a53d8f16
+Create Date: 2025-08-30 20:04:18.664573
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd1f8b64e9a27'
+down_revision = 'c9e7a53d8f16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_application_candidate_status',
+        'application',
+        ['candidate_id', 'status', 'id'],
+    )
+    op.create_index(
+        'ix_application_vacancy_status',
+        'application',
+        ['vacancy_id', 'status', 'id'],
+    )
+    op.create_index(
+        'ix_placement_team_id',
+        'placement',
+        ['team_id', 'id'],
+    )
+    op.create_index(
+        'ix_placement_candidate_id',
+        'placement',
+        ['candidate_id', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_placement_candidate_id', table_name='placement')
+    op.drop_index('ix_placement_team_id', table_name='placement')
+    op.drop_index('ix_application_vacancy_status', table_name='application')
+    op.drop_index('ix_application_candidate_status', table_name='application')
@@ -0,0 +1,54 @@
+"""add crud predicate indexes
+
+Revision ID: d4f9a21c7b38
+Revises: c3a8f47d1e92
+Create Date: 2025-08-30 16:41:18.205337
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd4f9a21c7b38'
+down_revision = 'c3a8f47d1e92'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_application_candidate_vacancy',
+        'application',
+        ['candidate_id', 'vacancy_id'],
+    )
+    op.create_index(
+        'ix_message_receiver_unread',
+        'message',
+        ['receiver_id'],
+        postgresql_where=sa.text('is_read = false'),
+    )
+    op.create_index(
+        'ix_placement_team_unpaid',
+        'placement',
+        ['team_id'],
+        postgresql_where=sa.text('invoice_generated AND NOT invoice_paid'),
+    )
+    op.create_index(
+        'ix_user_role_active',
+        'user',
+        ['role', 'is_active'],
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ix_membership_user_id',
+        'membership',
+        ['user_id', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_membership_user_id', table_name='membership')
+    op.drop_index('ix_user_role_active', table_name='user')
+    op.drop_index('ix_placement_team_unpaid', table_name='placement')
+    op.drop_index('ix_message_receiver_unread', table_name='message')
+    op.drop_index('ix_application_candidate_vacancy', table_name='application')
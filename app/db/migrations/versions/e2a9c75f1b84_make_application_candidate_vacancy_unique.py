@@ -0,0 +1,34 @@
+"""make application candidate vacancy index unique
+
+Revision ID: e2a9c75f1b84
+Revises: d1f8b64e9a27
+Create Date: 2025-08-30 20:41:52.118306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e2a9c75f1b84'
+down_revision = 'd1f8b64e9a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_application_candidate_vacancy', table_name='application')
+    op.create_index(
+        'ix_application_candidate_vacancy',
+        'application',
+        ['candidate_id', 'vacancy_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_candidate_vacancy', table_name='application')
+    op.create_index(
+        'ix_application_candidate_vacancy',
+        'application',
+        ['candidate_id', 'vacancy_id'],
+    )
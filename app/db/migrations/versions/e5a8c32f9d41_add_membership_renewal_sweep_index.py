@@ -0,0 +1,28 @@
+"""add membership renewal sweep index
+
+Revision ID: e5a8c32f9d41
+Revises: d4f9a21c7b38
+Create Date: 2025-08-30 18:12:44.530219
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e5a8c32f9d41'
+down_revision = 'd4f9a21c7b38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_membership_active_renewal',
+        'membership',
+        ['renewal_date'],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_membership_active_renewal', table_name='membership')
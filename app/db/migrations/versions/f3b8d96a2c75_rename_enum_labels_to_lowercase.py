@@ -0,0 +1,45 @@
+"""rename enum labels to lowercase
+
+The enum columns now persist member values (lowercase) instead of member
+names. RENAME VALUE keeps each label's OID, so partial-index predicates
+that reference the old uppercase labels follow the rename automatically.
+
+Revision ID: f3b8d96a2c75
+Revises: e2a9c75f1b84
+Create Date: 2025-08-30 21:17:09.482651
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d96a2c75'
+down_revision = 'e2a9c75f1b84'
+branch_labels = None
+depends_on = None
+
+
+_ENUM_LABELS = {
+    'applicationstatus': ['PENDING', 'ACCEPTED', 'DECLINED', 'WITHDRAWN'],
+    'membershipplan': ['BASIC', 'PREMIUM', 'PROFESSIONAL'],
+    'membershipstatus': ['ACTIVE', 'EXPIRED', 'CANCELLED', 'PENDING'],
+    'placementstatus': ['PENDING', 'CONFIRMED', 'COMPLETED', 'CANCELLED'],
+    'userrole': ['CANDIDATE', 'TEAM', 'ADMIN'],
+    'vacancystatus': ['ACTIVE', 'CLOSED', 'DRAFT'],
+}
+
+
+def upgrade() -> None:
+    for type_name, labels in _ENUM_LABELS.items():
+        for label in labels:
+            op.execute(
+                f"ALTER TYPE {type_name} RENAME VALUE '{label}' TO '{label.lower()}'"
+            )
+
+
+def downgrade() -> None:
+    for type_name, labels in _ENUM_LABELS.items():
+        for label in labels:
+            op.execute(
+                f"ALTER TYPE {type_name} RENAME VALUE '{label.lower()}' TO '{label}'"
+            )
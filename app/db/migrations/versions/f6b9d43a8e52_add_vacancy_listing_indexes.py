@@ -0,0 +1,35 @@
+"""add vacancy listing indexes
+
+Revision ID: f6b9d43a8e52
+Revises: e5a8c32f9d41
+Create Date: 2025-08-30 18:47:09.884316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f6b9d43a8e52'
+down_revision = 'e5a8c32f9d41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_vacancy_team_active',
+        'vacancy',
+        ['team_id', 'status'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_vacancy_active_expiry',
+        'vacancy',
+        ['expiry_date'],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vacancy_active_expiry', table_name='vacancy')
+    op.drop_index('ix_vacancy_team_active', table_name='vacancy')
@@ -1,14 +1,13 @@
-import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Enum as SQLEnum, String, Text, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from db.base_class import TimestampedBase
+from db.base_class import LowercaseStrEnum, TimestampedBase, values_enum
 
 
-class ApplicationStatus(str, enum.Enum):
+class ApplicationStatus(LowercaseStrEnum):
     PENDING = "pending"
     ACCEPTED = "accepted"
     DECLINED = "declined"
@@ -16,13 +15,22 @@ class ApplicationStatus(str, enum.Enum):
 
 
 class Application(TimestampedBase):
+    # Serves the per-candidate listings; unique so duplicate applications
+    # are rejected by the database itself (ON CONFLICT DO NOTHING)
+    __table_args__ = (
+        Index("ix_application_candidate_vacancy", "candidate_id", "vacancy_id", unique=True),
+        # Status-filtered pages in id (keyset) order
+        Index("ix_application_candidate_status", "candidate_id", "status", "id"),
+        Index("ix_application_vacancy_status", "vacancy_id", "status", "id"),
+    )
+
     candidate_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     vacancy_id: Mapped[int] = mapped_column(ForeignKey("vacancy.id"))
-    status: Mapped[ApplicationStatus] = mapped_column(SQLEnum(ApplicationStatus), default=ApplicationStatus.PENDING)
+    status: Mapped[ApplicationStatus] = mapped_column(values_enum(ApplicationStatus), default=ApplicationStatus.PENDING)
     cover_letter: Mapped[Optional[str]] = mapped_column(type_=Text(), default=None)
     additional_notes: Mapped[Optional[str]] = mapped_column(type_=Text(), default=None)
     
     # Relationships
-    candidate = relationship("User", back_populates="applications")
-    vacancy = relationship("Vacancy", back_populates="applications")
-    placement = relationship("Placement", back_populates="application", uselist=False) 
\ No newline at end of file
+    candidate = relationship("User", back_populates="applications", lazy="raise_on_sql")
+    vacancy = relationship("Vacancy", back_populates="applications", lazy="raise_on_sql")
+    placement = relationship("Placement", back_populates="application", uselist=False, lazy="raise_on_sql") 
\ No newline at end of file
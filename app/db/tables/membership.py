@@ -1,20 +1,19 @@
-import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Enum as SQLEnum, String, Numeric, ForeignKey
+from sqlalchemy import String, Numeric, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from db.base_class import TimestampedBase
+from db.base_class import LowercaseStrEnum, NaiveUTCDateTime, TimestampedBase, values_enum
 
 
-class MembershipPlan(str, enum.Enum):
+class MembershipPlan(LowercaseStrEnum):
     BASIC = "basic"
     PREMIUM = "premium"
     PROFESSIONAL = "professional"
 
 
-class MembershipStatus(str, enum.Enum):
+class MembershipStatus(LowercaseStrEnum):
     ACTIVE = "active"
     EXPIRED = "expired"
     CANCELLED = "cancelled"
@@ -22,14 +21,26 @@ class MembershipStatus(str, enum.Enum):
 
 
 class Membership(TimestampedBase):
+    # Serves the keyset-paginated membership history; active-status lookups
+    # already go through uniq_membership_active_user
+    __table_args__ = (
+        Index("ix_membership_user_id", "user_id", "id"),
+        # Range scan for the renewal sweep over active memberships
+        Index(
+            "ix_membership_active_renewal",
+            "renewal_date",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
-    plan_type: Mapped[MembershipPlan] = mapped_column(SQLEnum(MembershipPlan))
-    status: Mapped[MembershipStatus] = mapped_column(SQLEnum(MembershipStatus), default=MembershipStatus.PENDING)
+    plan_type: Mapped[MembershipPlan] = mapped_column(values_enum(MembershipPlan))
+    status: Mapped[MembershipStatus] = mapped_column(values_enum(MembershipStatus), default=MembershipStatus.PENDING)
     price: Mapped[float] = mapped_column(Numeric(10, 2))
-    start_date: Mapped[datetime] = mapped_column()
-    renewal_date: Mapped[datetime] = mapped_column()
+    start_date: Mapped[datetime] = mapped_column(NaiveUTCDateTime())
+    renewal_date: Mapped[datetime] = mapped_column(NaiveUTCDateTime())
     stripe_subscription_id: Mapped[Optional[str]] = mapped_column(type_=String(255), default=None)
     stripe_payment_intent_id: Mapped[Optional[str]] = mapped_column(type_=String(255), default=None)
     
     # Relationships
-    user = relationship("User", back_populates="memberships") 
\ No newline at end of file
+    user = relationship("User", back_populates="memberships", lazy="raise_on_sql") 
\ No newline at end of file
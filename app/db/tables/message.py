@@ -1,13 +1,30 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, ForeignKey, Boolean
+from sqlalchemy import String, Text, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.base_class import TimestampedBase
 
 
 class Message(TimestampedBase):
+    # Conversation paging is covered by ix_message_conversation
+    # (sender_id, receiver_id, id)
+    __table_args__ = (
+        # Inbox listing: newest messages for a receiver
+        Index("ix_message_inbox", "receiver_id", "created_at"),
+        # Unread rows only — tiny, serves the unread page and the thread
+        # unread counts in created_at order
+        Index(
+            "ix_message_unread_partial",
+            "receiver_id",
+            "created_at",
+            postgresql_where=text("is_read = false"),
+        ),
+        # Keyset-paginated replies under a parent message
+        Index("ix_message_thread", "parent_message_id", "id"),
+    )
+
     sender_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     receiver_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     subject: Mapped[Optional[str]] = mapped_column(type_=String(255), default=None)
@@ -16,7 +33,7 @@ class Message(TimestampedBase):
     parent_message_id: Mapped[Optional[int]] = mapped_column(ForeignKey("message.id"), default=None)
     
     # Relationships
-    sender = relationship("User", foreign_keys=[sender_id], back_populates="sent_messages")
-    receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_messages")
-    parent_message = relationship("Message", remote_side="Message.id")
-    replies = relationship("Message", back_populates="parent_message") 
\ No newline at end of file
+    sender = relationship("User", foreign_keys=[sender_id], back_populates="sent_messages", lazy="raise_on_sql")
+    receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_messages", lazy="raise_on_sql")
+    parent_message = relationship("Message", remote_side="Message.id", lazy="raise_on_sql")
+    replies = relationship("Message", back_populates="parent_message", lazy="raise_on_sql") 
\ No newline at end of file
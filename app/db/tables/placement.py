@@ -1,14 +1,13 @@
-import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Enum as SQLEnum, String, ForeignKey, Numeric, Boolean
+from sqlalchemy import String, ForeignKey, Numeric, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from db.base_class import TimestampedBase
+from db.base_class import LowercaseStrEnum, NaiveUTCDateTime, TimestampedBase, values_enum
 
 
-class PlacementStatus(str, enum.Enum):
+class PlacementStatus(LowercaseStrEnum):
     PENDING = "pending"
     CONFIRMED = "confirmed"
     COMPLETED = "completed"
@@ -16,21 +15,33 @@ class PlacementStatus(str, enum.Enum):
 
 
 class Placement(TimestampedBase):
+    # Partial index over invoiced-but-unpaid rows for the billing queries
+    __table_args__ = (
+        Index(
+            "ix_placement_team_unpaid",
+            "team_id",
+            postgresql_where=text("invoice_generated AND NOT invoice_paid"),
+        ),
+        # Per-team and per-candidate placement pages in id order
+        Index("ix_placement_team_id", "team_id", "id"),
+        Index("ix_placement_candidate_id", "candidate_id", "id"),
+    )
+
     application_id: Mapped[int] = mapped_column(ForeignKey("application.id"))
     candidate_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     team_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
     vacancy_id: Mapped[int] = mapped_column(ForeignKey("vacancy.id"))
-    status: Mapped[PlacementStatus] = mapped_column(SQLEnum(PlacementStatus), default=PlacementStatus.PENDING)
+    status: Mapped[PlacementStatus] = mapped_column(values_enum(PlacementStatus), default=PlacementStatus.PENDING)
     
     # Invoice details
     invoice_amount: Mapped[float] = mapped_column(Numeric(10, 2), default=50.00)  # Fixed $50 fee
     invoice_generated: Mapped[bool] = mapped_column(Boolean, default=False)
     invoice_paid: Mapped[bool] = mapped_column(Boolean, default=False)
     invoice_pdf_path: Mapped[Optional[str]] = mapped_column(type_=String(500), default=None)
-    payment_due_date: Mapped[Optional[datetime]] = mapped_column(default=None)
+    payment_due_date: Mapped[Optional[datetime]] = mapped_column(NaiveUTCDateTime(), default=None)
     
     # Relationships
-    application = relationship("Application", back_populates="placement")
-    candidate = relationship("User", foreign_keys=[candidate_id])
-    team = relationship("User", foreign_keys=[team_id])
-    vacancy = relationship("Vacancy") 
\ No newline at end of file
+    application = relationship("Application", back_populates="placement", lazy="raise_on_sql")
+    candidate = relationship("User", foreign_keys=[candidate_id], lazy="raise_on_sql")
+    team = relationship("User", foreign_keys=[team_id], lazy="raise_on_sql")
+    vacancy = relationship("Vacancy", lazy="raise_on_sql") 
\ No newline at end of file
@@ -1,31 +1,48 @@
-import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Enum as SQLEnum, String, Text, Boolean, ForeignKey
+from sqlalchemy import String, Text, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from db.base_class import TimestampedBase
+from db.base_class import LowercaseStrEnum, NaiveUTCDateTime, TimestampedBase, values_enum
 
 
-class UserRole(str, enum.Enum):
+class UserRole(LowercaseStrEnum):
     CANDIDATE = "candidate"
     TEAM = "team"
     ADMIN = "admin"
 
 
 class User(TimestampedBase):
+    # Serves role-filtered listings (candidate search, pending teams);
+    # inactive accounts are excluded so the index stays small
+    __table_args__ = (
+        Index(
+            "ix_user_role_active",
+            "role",
+            "is_active",
+            postgresql_where=text("is_active"),
+        ),
+        # Admin approval queue: the pending-team subset is tiny, so this
+        # partial index is nearly free to maintain
+        Index(
+            "ix_user_team_pending_approval",
+            "id",
+            postgresql_where=text("role = 'team' AND NOT is_approved"),
+        ),
+    )
+
     first_name: Mapped[str] = mapped_column()
     last_name: Mapped[str] = mapped_column()
     email: Mapped[str] = mapped_column(unique=True, index=True)
     hashed_password: Mapped[str] = mapped_column(type_=String(255))
-    role: Mapped[UserRole] = mapped_column(SQLEnum(UserRole))
+    role: Mapped[UserRole] = mapped_column(values_enum(UserRole))
     is_active: Mapped[bool] = mapped_column(default=False)
     is_approved: Mapped[bool] = mapped_column(default=False)  # For teams approval
     email_verified: Mapped[bool] = mapped_column(default=False)  # Track email verification
     
     # Candidate-specific fields
-    birthdate: Mapped[Optional[datetime]] = mapped_column(default=None)
+    birthdate: Mapped[Optional[datetime]] = mapped_column(NaiveUTCDateTime(), default=None)
     position: Mapped[Optional[str]] = mapped_column(type_=String(255), default=None)
     experience_level: Mapped[Optional[str]] = mapped_column(type_=String(255), default=None)
     qualification: Mapped[Optional[str]] = mapped_column(type_=Text(), default=None)
@@ -38,8 +55,8 @@ class User(TimestampedBase):
     logo_file_path: Mapped[Optional[str]] = mapped_column(type_=String(500), default=None)
     
     # Relationships
-    memberships = relationship("Membership", back_populates="user")
-    applications = relationship("Application", back_populates="candidate")
-    vacancies = relationship("Vacancy", back_populates="team")
-    sent_messages = relationship("Message", foreign_keys="Message.sender_id", back_populates="sender")
-    received_messages = relationship("Message", foreign_keys="Message.receiver_id", back_populates="receiver")
+    memberships = relationship("Membership", back_populates="user", lazy="raise_on_sql")
+    applications = relationship("Application", back_populates="candidate", lazy="raise_on_sql")
+    vacancies = relationship("Vacancy", back_populates="team", lazy="raise_on_sql")
+    sent_messages = relationship("Message", foreign_keys="Message.sender_id", back_populates="sender", lazy="raise_on_sql")
+    received_messages = relationship("Message", foreign_keys="Message.receiver_id", back_populates="receiver", lazy="raise_on_sql")
@@ -1,20 +1,49 @@
-import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Enum as SQLEnum, String, Text, ForeignKey, Numeric
+from sqlalchemy import String, Text, ForeignKey, Index, Numeric, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from db.base_class import TimestampedBase
+from db.base_class import LowercaseStrEnum, NaiveUTCDateTime, TimestampedBase, values_enum
 
 
-class VacancyStatus(str, enum.Enum):
+class VacancyStatus(LowercaseStrEnum):
     ACTIVE = "active"
     CLOSED = "closed"
     DRAFT = "draft"
 
 
 class Vacancy(TimestampedBase):
+    __table_args__ = (
+        # Per-team listings; soft-deleted rows never leave these queries
+        Index(
+            "ix_vacancy_team_active",
+            "team_id",
+            "status",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Range scan for the expiry sweep over active vacancies
+        Index(
+            "ix_vacancy_active_expiry",
+            "expiry_date",
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Trigram indexes serving the lower()/LIKE substring search filters
+        Index("ix_vacancy_title_trgm", text("lower(title) gin_trgm_ops"), postgresql_using="gin"),
+        Index("ix_vacancy_location_trgm", text("lower(location) gin_trgm_ops"), postgresql_using="gin"),
+        Index(
+            "ix_vacancy_experience_trgm",
+            text("lower(experience_level) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_vacancy_position_trgm",
+            text("lower(position_type) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
+
+
     title: Mapped[str] = mapped_column(type_=String(255))
     description: Mapped[str] = mapped_column(type_=Text())
     requirements: Mapped[str] = mapped_column(type_=Text())
@@ -23,12 +52,12 @@ class Vacancy(TimestampedBase):
     location: Mapped[str] = mapped_column(type_=String(255))
     position_type: Mapped[str] = mapped_column(type_=String(100))  # player, coach, manager, etc.
     experience_level: Mapped[str] = mapped_column(type_=String(100))  # junior, senior, etc.
-    expiry_date: Mapped[datetime] = mapped_column()
-    status: Mapped[VacancyStatus] = mapped_column(SQLEnum(VacancyStatus), default=VacancyStatus.DRAFT)
+    expiry_date: Mapped[datetime] = mapped_column(NaiveUTCDateTime())
+    status: Mapped[VacancyStatus] = mapped_column(values_enum(VacancyStatus), default=VacancyStatus.DRAFT)
     
     # Foreign Keys
     team_id: Mapped[int] = mapped_column(ForeignKey("user.id"))  # Team user who created this vacancy
     
     # Relationships
-    team = relationship("User", back_populates="vacancies")
-    applications = relationship("Application", back_populates="vacancy") 
\ No newline at end of file
+    team = relationship("User", back_populates="vacancies", lazy="raise_on_sql")
+    applications = relationship("Application", back_populates="vacancy", lazy="raise_on_sql") 
\ No newline at end of file
@@ -1,15 +1,21 @@
+import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.cors import CORSMiddleware
 import redis.asyncio as aioredis
+import stripe
 
 from api.dependencies.docs_security import basic_http_credentials
 from api.dependencies.rate_limiter import FastAPILimiter
 from core.config import settings, EnvironmentEnum
 from utils.redis_manager import RedisManager
+from utils.stripe_utils import StripeHTTPXClient
 
 from db.session import engine
 
@@ -20,15 +26,28 @@ FastAPI Footy project 🚀
 """
 version = "v0.0.1"
 
+# Non-blocking logging: handlers only enqueue records, a background thread
+# drains them to the stream so log I/O never serializes with request handling
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logging.basicConfig(
+    level=logging.INFO,
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     redis_url = str(settings.REDIS_URL)
 
+    # One capped pool for the whole process — every cache, limiter and
+    # helper goes through this client instead of opening its own sockets
     redis_pool = aioredis.ConnectionPool.from_url(
         redis_url,
         encoding="utf-8",
-        decode_responses=True
+        decode_responses=True,
+        max_connections=64
     )
     redis_client = aioredis.Redis.from_pool(redis_pool)
 
@@ -39,6 +58,12 @@ async def lifespan(_: FastAPI):
         raise
 
     RedisManager.set_client(redis_client)
+    app.state.redis = redis_client
+
+    # One pooled HTTP/2 transport for every async Stripe call: TLS setup is
+    # amortized across requests and concurrent calls multiplex over a
+    # handful of connections instead of one socket each
+    stripe.default_http_client = StripeHTTPXClient(timeout=30)
 
     await FastAPILimiter.init(
         redis_client,
@@ -47,6 +72,7 @@ async def lifespan(_: FastAPI):
 
     yield
 
+    await stripe.default_http_client.close_async()
     await redis_client.close()
     await engine.dispose()
 
@@ -64,6 +90,7 @@ app = FastAPI(
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware should be added BEFORE TrustedHostMiddleware
@@ -1,9 +1,7 @@
 from typing import Optional
 from datetime import datetime
 
-from pydantic import field_validator
-
-from schemas.base import BaseSchema, BasePaginatedSchema
+from schemas.base import BaseSchema, BasePaginatedSchema, DeferredBuildSchema
 from db.tables.application import ApplicationStatus
 
 
@@ -17,7 +15,7 @@ class CreateApplicationSchema(ApplicationSchemaBase):
     pass
 
 
-class UpdateApplicationSchema(BaseSchema):
+class UpdateApplicationSchema(DeferredBuildSchema):
     status: Optional[ApplicationStatus] = None
     cover_letter: Optional[str] = None
     additional_notes: Optional[str] = None
@@ -30,12 +28,6 @@ class OutApplicationSchema(ApplicationSchemaBase):
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("status", mode="before")
-    def normalize_role(cls, v):
-        if isinstance(v, str):
-            return v.lower()
-        return v
-
 
 class PaginatedApplicationSchema(BasePaginatedSchema[OutApplicationSchema]):
     items: list[OutApplicationSchema]
@@ -1,5 +1,20 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Generic, TypeVar
+import re
+from pydantic import AfterValidator, BaseModel, ConfigDict
+from typing import Annotated, Generic, TypeVar
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _validate_email(value: str) -> str:
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+# Shape check via one compiled regex instead of EmailStr, whose
+# email-validator parse runs on every login/registration field; real
+# deliverability is only proven by the verification email anyway
+Email = Annotated[str, AfterValidator(_validate_email)]
 
 
 class BaseSchema(BaseModel):
@@ -8,6 +23,29 @@ class BaseSchema(BaseModel):
         use_enum_values=True,
     )
 
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """Build an instance from a trusted ORM row without validation.
+
+        model_construct skips the pydantic-core descent entirely — the
+        dominant per-row cost when converting result sets the database
+        has already typed. Only for rows read back from our own tables;
+        never for user-submitted payloads, which must keep model_validate.
+        """
+        return cls.model_construct(**{f: getattr(obj, f) for f in cls.model_fields})
+
+
+class DeferredBuildSchema(BaseSchema):
+    """Base for update/search/request-only schemas off the hot read path.
+
+    defer_build skips pydantic-core schema construction at import time;
+    the core schema is built lazily on first validation instead, cutting
+    cold-start work and per-worker memory for models most requests never
+    touch.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
 
 BASE_SCHEMA = TypeVar("BASE_SCHEMA", bound=BaseSchema)
 
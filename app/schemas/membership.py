@@ -1,9 +1,8 @@
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, field_validator
 
-from schemas.base import BaseSchema, BasePaginatedSchema
+from schemas.base import BaseSchema, BasePaginatedSchema, DeferredBuildSchema
 from db.tables.membership import MembershipPlan, MembershipStatus
 
 
@@ -19,7 +18,7 @@ class CreateMembershipSchema(MembershipSchemaBase):
     pass
 
 
-class UpdateMembershipSchema(BaseSchema):
+class UpdateMembershipSchema(DeferredBuildSchema):
     plan_type: Optional[MembershipPlan] = None
     status: Optional[MembershipStatus] = None
     price: Optional[Decimal] = None
@@ -28,29 +27,16 @@ class UpdateMembershipSchema(BaseSchema):
 
 
 class OutMembershipSchema(MembershipSchemaBase):
+    # price/plan_type stay as the base's required fields: the columns are
+    # NOT NULL, and re-declaring them Optional here just built a nullable
+    # union validator for values that are never None
     id: int
     status: MembershipStatus
-    price: Optional[Decimal] = None
-    plan_type: Optional[MembershipPlan] = None
     stripe_subscription_id: Optional[str] = None
     stripe_payment_intent_id: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
-    @field_validator('status', mode='before')
-    @classmethod
-    def normalize_status(cls, v):
-        if isinstance(v, str):
-            return v.lower()
-        return v
-
-    @field_validator('plan_type', mode='before')
-    @classmethod
-    def normalize_plan(cls, v):
-        if isinstance(v, str):
-            return v.lower()
-        return v
-
 
 class PaginatedMembershipSchema(BasePaginatedSchema[OutMembershipSchema]):
     items: list[OutMembershipSchema]
@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime
 
-from schemas.base import BaseSchema, BasePaginatedSchema
+from schemas.base import BaseSchema, BasePaginatedSchema, DeferredBuildSchema
 
 
 class MessageSchemaBase(BaseSchema):
@@ -15,7 +15,7 @@ class CreateMessageSchema(MessageSchemaBase):
     pass
 
 
-class UpdateMessageSchema(BaseSchema):
+class UpdateMessageSchema(DeferredBuildSchema):
     is_read: Optional[bool] = None
 
 
@@ -1,17 +1,17 @@
-from .base import BaseSchema
+from .base import DeferredBuildSchema
 
 
-class CustomerRequest(BaseSchema):
+class CustomerRequest(DeferredBuildSchema):
     email: str
     name: str = None
 
 
-class SubscriptionRequest(BaseSchema):
+class SubscriptionRequest(DeferredBuildSchema):
     customer_id: str
     price_id: str
     trial_period_days: int = 0
 
 
-class UpdateSubscriptionRequest(BaseSchema):
+class UpdateSubscriptionRequest(DeferredBuildSchema):
     subscription_id: str
     new_price_id: str
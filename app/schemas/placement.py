@@ -2,7 +2,7 @@ from typing import Optional
 from datetime import datetime
 from decimal import Decimal
 
-from schemas.base import BaseSchema, BasePaginatedSchema
+from schemas.base import BaseSchema, BasePaginatedSchema, DeferredBuildSchema
 from db.tables.placement import PlacementStatus
 
 
@@ -17,7 +17,7 @@ class CreatePlacementSchema(PlacementSchemaBase):
     pass
 
 
-class UpdatePlacementSchema(BaseSchema):
+class UpdatePlacementSchema(DeferredBuildSchema):
     status: Optional[PlacementStatus] = None
     invoice_amount: Optional[Decimal] = None
     payment_due_date: Optional[datetime] = None
@@ -39,5 +39,5 @@ class PaginatedPlacementSchema(BasePaginatedSchema[OutPlacementSchema]):
     items: list[OutPlacementSchema]
 
 
-class PlacementConfirmationSchema(BaseSchema):
+class PlacementConfirmationSchema(DeferredBuildSchema):
     application_id: int 
\ No newline at end of file
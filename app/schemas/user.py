@@ -1,24 +1,17 @@
 from typing import Optional
 from datetime import datetime
-from pydantic import EmailStr, validator, field_validator
+from pydantic import field_validator
 
-from schemas.base import BaseSchema, BasePaginatedSchema
+from schemas.base import BaseSchema, BasePaginatedSchema, DeferredBuildSchema, Email
 from db.tables.user import UserRole
 
 
 class UserSchemaBase(BaseSchema):
     first_name: str
     last_name: str
-    email: EmailStr
+    email: Email
     role: UserRole
 
-    @field_validator('role', mode='before')
-    @classmethod
-    def normalize_role(cls, v):
-        if isinstance(v, str):
-            return v.lower()
-        return v
-
 
 class CandidateRegistrationSchema(UserSchemaBase):
     password: str
@@ -34,13 +27,6 @@ class CandidateRegistrationSchema(UserSchemaBase):
             raise ValueError('Role must be candidate for candidate registration')
         return v
 
-    @field_validator('birthdate')
-    def validate_birthdate(cls, v):
-        if v and v.tzinfo is not None:
-            # Convert timezone-aware datetime to timezone-naive (remove timezone info)
-            return v.replace(tzinfo=None)
-        return v
-
 
 class TeamRegistrationSchema(UserSchemaBase):
     password: str
@@ -54,10 +40,10 @@ class TeamRegistrationSchema(UserSchemaBase):
         return v
 
 
-class UpdateUserSchema(BaseSchema):
+class UpdateUserSchema(DeferredBuildSchema):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     is_active: Optional[bool] = None
     is_approved: Optional[bool] = None
 
@@ -74,13 +60,6 @@ class UpdateUserSchema(BaseSchema):
     
     hashed_password: Optional[str] = None
 
-    @field_validator('birthdate')
-    def validate_birthdate(cls, v):
-        if v and v.tzinfo is not None:
-            # Convert timezone-aware datetime to timezone-naive (remove timezone info)
-            return v.replace(tzinfo=None)
-        return v
-
 
 class OutUserSchema(UserSchemaBase):
     id: int
@@ -103,24 +82,17 @@ class OutUserSchema(UserSchemaBase):
     contact_phone: Optional[str] = None
     logo_file_path: Optional[str] = None
 
-    @field_validator('birthdate', 'created_at', 'updated_at')
-    def validate_datetime_fields(cls, v):
-        if v and v.tzinfo is not None:
-            # Convert timezone-aware datetime to timezone-naive (remove timezone info)
-            return v.replace(tzinfo=None)
-        return v
-
 
 class PaginatedUserSchema(BasePaginatedSchema[OutUserSchema]):
     items: list[OutUserSchema]
 
 
 class UserLoginSchema(BaseSchema):
-    email: EmailStr
+    email: Email
     password: str
 
 
-class CandidateSearchSchema(BaseSchema):
+class CandidateSearchSchema(DeferredBuildSchema):
     role: Optional[str] = None
     experience_level: Optional[str] = None
     location: Optional[str] = None
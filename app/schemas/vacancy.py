@@ -2,9 +2,9 @@ from typing import Optional
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import field_validator
+from pydantic import AliasChoices, AliasPath, Field
 
-from schemas.base import BaseSchema, BasePaginatedSchema
+from schemas.base import BaseSchema, BasePaginatedSchema, DeferredBuildSchema
 from db.tables.vacancy import VacancyStatus
 
 
@@ -15,21 +15,17 @@ class VacancySchemaBase(BaseSchema):
     location: str
     position_type: str
     experience_level: str
+    # Aware inputs are converted to naive UTC by the NaiveUTCDateTime
+    # column type at bind time
     expiry_date: datetime
 
-    @field_validator("expiry_date")
-    def remove_timezone(cls, value: datetime) -> datetime:
-        if value.tzinfo:
-            return value.replace(tzinfo=None)
-        return value
-
 
 class CreateVacancySchema(VacancySchemaBase):
     salary_min: Optional[Decimal] = None
     salary_max: Optional[Decimal] = None
 
 
-class UpdateVacancySchema(BaseSchema):
+class UpdateVacancySchema(DeferredBuildSchema):
     title: Optional[str] = None
     description: Optional[str] = None
     requirements: Optional[str] = None
@@ -51,27 +47,28 @@ class OutVacancySchema(VacancySchemaBase):
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("status", mode="before")
-    def transform_status_to_lowercase(cls, value: str) -> str:
-        # Transform DB uppercase values to lowercase for API response
-        return value.lower() if isinstance(value, str) else value
-
 
-class OutVacancyListSchema(VacancySchemaBase):
+class OutVacancyListSchema(BaseSchema):
+    # List view: deliberately omits the description/requirements Text
+    # blobs so list pages stay narrow end to end
     id: int
+    title: str
+    location: str
+    position_type: str
+    experience_level: str
+    expiry_date: datetime
     salary_min: Optional[Decimal] = None
     salary_max: Optional[Decimal] = None
     status: VacancyStatus
     team_id: int
-    team_name: Optional[str] = None  # Added team_name field
+    # Resolved straight from the joined team row so list endpoints don't
+    # need a per-item patch loop
+    team_name: Optional[str] = Field(
+        None, validation_alias=AliasChoices("team_name", AliasPath("team", "club_name"))
+    )
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("status", mode="before")
-    def transform_status_to_lowercase(cls, value: str) -> str:
-        # Transform DB uppercase values to lowercase for API response
-        return value.lower() if isinstance(value, str) else value
-
 
 class PaginatedVacancySchema(BasePaginatedSchema[OutVacancySchema]):
     items: list[OutVacancySchema]
@@ -79,9 +76,13 @@ class PaginatedVacancySchema(BasePaginatedSchema[OutVacancySchema]):
 
 class PaginatedVacancyListSchema(BasePaginatedSchema[OutVacancyListSchema]):
     items: list[OutVacancyListSchema]
+    # Cursor-paginated responses skip the total (no COUNT) and hand back
+    # an opaque cursor for the next page instead
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
-class VacancySearchSchema(BaseSchema):
+class VacancySearchSchema(DeferredBuildSchema):
     role: Optional[str] = None
     location: Optional[str] = None
     salary_min: Optional[Decimal] = None
@@ -1,6 +1,6 @@
 from celery_config import celery_app
-from utils.email import send_mail
-from typing import Dict
+from utils.email import send_mail, send_mail_batch
+from typing import Dict, List
 
 
 @celery_app.task(name="send_email_notification")
@@ -13,3 +13,19 @@ def send_email_task(to_email: str, subject: str, template: str, context: Dict[st
         context=context,
         to_name=to_name
     )
+
+
+@celery_app.task(name="send_email_batch_notification")
+def send_email_batch_task(recipients: List[Dict[str, str]], subject: str, template: str, context: Dict[str, str]):
+    """Celery task to send one templated email to many recipients.
+
+    One broker message and one render for the whole list; delivery is
+    chunked into multi-recipient API calls instead of one task and one
+    HTTPS round-trip per recipient.
+    """
+    return send_mail_batch(
+        recipients=recipients,
+        subject=subject,
+        template_name=template,
+        context=context
+    )
@@ -1,7 +1,7 @@
 from app.celery_config import celery_app
-from utils.sms import twilio_client
+from utils.sms import get_twilio_client
 
 
 @celery_app.task(name="send_sms_notification")
 def send_sms_task(phone: str, message: str):
-    twilio_client.send_sms(phone_number=phone, message=message)
+    get_twilio_client().send_sms(phone_number=phone, message=message)
@@ -0,0 +1,35 @@
+import logging
+
+from celery_config import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="handle_stripe_event")
+def handle_stripe_event(event_type: str, data: dict):
+    """Process a verified Stripe event off the webhook request path."""
+    if event_type == 'customer.subscription.created':
+        logger.info("New subscription created: %s", data.get('id'))
+        # Add user to subscription in your database
+
+    elif event_type == 'customer.subscription.updated':
+        logger.info("Subscription updated: %s", data.get('id'))
+        # Update subscription status in your database
+
+    elif event_type == 'customer.subscription.deleted':
+        logger.info("Subscription canceled: %s", data.get('id'))
+        # Remove user access in your database
+
+    elif event_type == 'invoice.payment_succeeded':
+        logger.info("Subscription payment succeeded: %s", data.get('subscription'))
+        # Extend user access period
+
+    elif event_type == 'invoice.payment_failed':
+        logger.warning("Subscription payment failed: %s", data.get('subscription'))
+
+    elif event_type == 'customer.subscription.trial_will_end':
+        # TODO: send notifs
+        logger.info("Trial ending soon: %s", data.get('id'))
+
+    else:
+        logger.info("Unhandled event type: %s", event_type)
@@ -1,14 +1,51 @@
+import logging
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 from jinja2 import Environment, FileSystemLoader
-import sib_api_v3_sdk
-from sib_api_v3_sdk.rest import ApiException
 from core.config import settings
 
+# sib_api_v3_sdk is imported inside the send paths, not here: the SDK
+# pulls in its whole generated client at import, and this module is on
+# the web workers' import chain via the auth router even though only
+# celery workers actually send mail
+
 # Initialize Jinja2 environment
+logger = logging.getLogger(__name__)
+
+# The celery workers run a gevent pool, which does not enforce task time
+# limits — a send that hangs would pin its greenlet forever, and with
+# acks_late redeliver on shutdown. Every Brevo call carries this
+# timeout instead.
+_REQUEST_TIMEOUT = 20  # seconds
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TEMPLATES_DIR = os.path.join(BASE_DIR, "templates", "email")
-env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+# auto_reload=False skips the mtime stat() on every get_template, so a
+# template is read and compiled once per worker and served from the
+# environment cache afterwards; templates only change with a deploy
+env = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    cache_size=400,
+    auto_reload=False,
+)
+
+
+@lru_cache(maxsize=1)
+def _transactional_api():
+    """One Brevo client per worker.
+
+    The ApiClient carries the TLS context and urllib3 pool; building it
+    once lets consecutive sends reuse keep-alive sockets instead of
+    paying a fresh HTTPS handshake per email.
+    """
+    import sib_api_v3_sdk
+
+    configuration = sib_api_v3_sdk.Configuration()
+    configuration.api_key['api-key'] = settings.brevo.BREVO_API_KEY
+    return sib_api_v3_sdk.TransactionalEmailsApi(
+        sib_api_v3_sdk.ApiClient(configuration)
+    )
 
 
 class EmailManager:
@@ -26,15 +63,12 @@ class EmailManager:
             to_name: Optional[str] = None
     ) -> bool:
         """Send an email using Brevo API v3."""
-        try:
-            # Configure API key
-            configuration = sib_api_v3_sdk.Configuration()
-            configuration.api_key['api-key'] = settings.BREVO_API_KEY
+        import sib_api_v3_sdk
+        from sib_api_v3_sdk.rest import ApiException
 
-            # Create an instance of the API class
-            api_instance = sib_api_v3_sdk.TransactionalEmailsApi(
-                sib_api_v3_sdk.ApiClient(configuration)
-            )
+        try:
+            # Shared per-worker client — see _transactional_api
+            api_instance = _transactional_api()
 
             # Prepare the email
             send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(
@@ -43,29 +77,94 @@ class EmailManager:
                     "name": to_name or to_email
                 }],
                 sender={
-                    "name": settings.MAIL_FROM_NAME,
-                    "email": settings.MAIL_FROM
+                    "name": settings.brevo.MAIL_FROM_NAME,
+                    "email": settings.brevo.MAIL_FROM
                 },
                 subject=subject,
                 html_content=html_content
             )
 
             # Make the API call
-            result = api_instance.send_transac_email(send_smtp_email)
-            print(f"Email sent successfully. Message ID: {result}")
+            result = api_instance.send_transac_email(
+                send_smtp_email, _request_timeout=_REQUEST_TIMEOUT
+            )
+            logger.info("Email sent successfully. Message ID: %s", result)
             return True
 
         except ApiException as e:
-            print(f"Error sending email via Brevo API:")
-            print(f"Status code: {e.status}")
-            print(f"Reason: {e.reason}")
-            print(f"Body: {e.body}")
+            logger.error(
+                "Error sending email via Brevo API: status=%s reason=%s body=%s",
+                e.status, e.reason, e.body,
+            )
             return False
-        except Exception as e:
-            print(f"Unexpected error sending email: {e}")
+        except Exception:
+            logger.exception("Unexpected error sending email")
             return False
 
 
+# Brevo accepts at most 99 recipients per send_transac_email call
+_BATCH_SIZE = 99
+
+
+def send_mail_batch(
+        recipients: list,
+        subject: str,
+        template_name: str,
+        context: Dict[str, str]
+) -> bool:
+    """Send one templated email to many recipients.
+
+    Renders the template once and fans the recipient list out in chunks
+    of up to 99 per API call, instead of one render + one HTTPS
+    round-trip per recipient. Recipients are dicts with "email" and an
+    optional "name".
+    """
+    import sib_api_v3_sdk
+    from sib_api_v3_sdk.rest import ApiException
+
+    email_manager = EmailManager()
+
+    try:
+        html_content = email_manager.render_template(template_name, context)
+    except Exception:
+        logger.exception("Failed to render email template %s", template_name)
+        return False
+
+    all_sent = True
+    for start in range(0, len(recipients), _BATCH_SIZE):
+        batch = recipients[start:start + _BATCH_SIZE]
+        try:
+            api_instance = _transactional_api()
+            send_smtp_email = sib_api_v3_sdk.SendSmtpEmail(
+                to=[
+                    {
+                        "email": recipient["email"],
+                        "name": recipient.get("name") or recipient["email"]
+                    }
+                    for recipient in batch
+                ],
+                sender={
+                    "name": settings.brevo.MAIL_FROM_NAME,
+                    "email": settings.brevo.MAIL_FROM
+                },
+                subject=subject,
+                html_content=html_content
+            )
+            api_instance.send_transac_email(
+                send_smtp_email, _request_timeout=_REQUEST_TIMEOUT
+            )
+        except ApiException as e:
+            logger.error(
+                "Error sending batch email via Brevo API: status=%s reason=%s body=%s",
+                e.status, e.reason, e.body,
+            )
+            all_sent = False
+        except Exception:
+            logger.exception("Unexpected error sending batch email")
+            all_sent = False
+    return all_sent
+
+
 def send_mail(
         to_email: str,
         subject: str,
@@ -87,6 +186,6 @@ def send_mail(
             html_content=html_content,
             to_name=to_name
         )
-    except Exception as e:
-        print(f"Failed to send email: {e}")
+    except Exception:
+        logger.exception("Failed to send email")
         return False
\ No newline at end of file
@@ -1,18 +1,51 @@
 import uuid
+from functools import lru_cache
 from io import BytesIO
 
-import boto3
 from core.config import settings
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import os
 
+# CV uploads are typically well under 8MB, so the raised multipart
+# threshold keeps them as one PUT instead of a spurious multipart
+# dance; keep-alive and a larger pool let the client reuse TLS
+# connections across calls
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive"},
+)
 
+
+@lru_cache(maxsize=1)
 def get_s3_client():
+    # One client per process: building one runs the botocore session,
+    # credential and endpoint resolvers every time, and a fresh client
+    # starts with an empty connection pool. boto3 clients are
+    # thread-safe, so callers can share it.
+    # boto3 is imported here rather than at module load: it pulls dozens
+    # of submodules and service models, which web workers that never
+    # touch S3 shouldn't pay for at startup.
+    import boto3
+
     return boto3.client(
         "s3",
         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
         region_name=settings.AWS_REGION,
+        config=_CLIENT_CONFIG,
+    )
+
+
+@lru_cache(maxsize=1)
+def _transfer_config():
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        max_concurrency=4,
+        use_threads=True,
     )
 
 
@@ -26,7 +59,8 @@ def upload_cv_to_s3(file_obj: BytesIO, filename: str, content_type: str) -> str:
         Fileobj=file_obj,
         Bucket=settings.AWS_S3_BUCKET_NAME,
         Key=key,
-        ExtraArgs={"ContentType": content_type}
+        ExtraArgs={"ContentType": content_type},
+        Config=_transfer_config(),
     )
 
     return key
@@ -1,24 +1,43 @@
-from twilio.rest import Client
-from twilio.rest.api.v2010.account.message import MessageInstance
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from core.config import settings
 
+if TYPE_CHECKING:
+    from twilio.rest.api.v2010.account.message import MessageInstance
+
+
+# The celery workers run a gevent pool, which does not enforce task time
+# limits — a hung Twilio request would pin its greenlet forever. The
+# per-request timeout below bounds it instead.
+_REQUEST_TIMEOUT = 15  # seconds
+
 
 class TwilioClient:
     def __init__(self):
+        # twilio is imported here rather than at module load so web
+        # workers that never send SMS don't pay for the SDK at startup
+        from twilio.http.http_client import TwilioHttpClient
+        from twilio.rest import Client
+
         self._client = Client(
-            settings.TWILIO_ACCOUNT_SID,
-            settings.TWILIO_AUTH_TOKEN,
+            settings.twilio.TWILIO_ACCOUNT_SID,
+            settings.twilio.TWILIO_AUTH_TOKEN,
+            http_client=TwilioHttpClient(timeout=_REQUEST_TIMEOUT),
         )
-        self._messaging_service_sid = settings.TWILIO_MESSAGING_SERVICE_SID
+        self._messaging_service_sid = settings.twilio.TWILIO_MESSAGING_SERVICE_SID
 
-    # TODO: convert to asnyc    
+    # Deliberately sync: the callers are celery tasks on a gevent pool,
+    # where the monkey-patched sockets already yield cooperatively — an
+    # event loop would add startup cost per task without adding
+    # concurrency. The per-worker client below already reuses one
+    # authenticated session.
     def send_sms(
         self,
         phone_number: str,
         message: str,
         shorten_urls: bool = False,
-    ) -> MessageInstance:
+    ) -> "MessageInstance":
         return self._client.messages.create(
             body=message,
             to=phone_number,
@@ -27,4 +46,7 @@ class TwilioClient:
         )
 
 
-twilio_client = TwilioClient()
+@lru_cache(maxsize=1)
+def get_twilio_client() -> TwilioClient:
+    """One Twilio client per worker, built on first send."""
+    return TwilioClient()
@@ -1,16 +1,159 @@
+import asyncio
 import logging
+import random
+import time
+from contextlib import asynccontextmanager
 from typing import Optional
+from uuid import uuid4
 
+import httpx
 import stripe
 from fastapi import HTTPException
 from starlette import status
 from stripe.checkout import Session
-from asyncer import asyncify
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import settings
+from utils.redis_manager import RedisManager
 
-stripe.api_key = settings.STRIPE_PUBLIC_KEY
+stripe.api_key = settings.stripe.STRIPE_SECRET_KEY
+
+
+class StripeHTTPXClient(stripe.http_client.HTTPXClient):
+    """Stripe transport over httpx with HTTP/2 and a bounded pool.
+
+    api.stripe.com speaks HTTP/2, so one multiplexed connection carries
+    many concurrent calls instead of each opening its own TLS socket.
+    The stock HTTPXClient doesn't expose httpx options, so the async
+    client is rebuilt here with http2 and explicit pool limits.
+    """
+
+    def __init__(self, timeout: int = 30):
+        super().__init__(timeout=timeout)
+        self._client_async = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            timeout=timeout,
+        )
+
+# Stripe enforces per-account request caps (100 rps live); keep a bounded
+# number of calls in flight, pace them below the cap with a token bucket,
+# and retry transient failures instead of surfacing them as 400s
+_STRIPE_MAX_CONCURRENCY = 16
+_STRIPE_MAX_ATTEMPTS = 6
+_STRIPE_MAX_BACKOFF = 30  # seconds
+_STRIPE_RATE_LIMIT = 90  # requests per second, under Stripe's live cap
+_stripe_semaphore = asyncio.Semaphore(_STRIPE_MAX_CONCURRENCY)
+
+
+class _TokenBucket:
+    """Minimal async token bucket: `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: int, period: float = 1.0):
+        self._rate = rate
+        self._period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._rate,
+                    self._tokens + (now - self._updated) * self._rate / self._period,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._period / self._rate)
+
+
+_stripe_bucket = _TokenBucket(_STRIPE_RATE_LIMIT)
+
+# The semaphore and bucket above only bound one process; with several
+# gunicorn workers each would happily run 16 calls at once. A sorted set
+# in Redis tracks every in-flight call across the fleet, so the global
+# ceiling holds no matter how many workers are running. Entries carry a
+# timestamp score and are swept on each acquire, so slots leaked by a
+# crashed worker free themselves after the window
+_STRIPE_GLOBAL_CONCURRENCY = 32
+_STRIPE_SLOT_KEY = "stripe:inflight"
+_STRIPE_SLOT_WINDOW = 60  # seconds before a stale slot is reclaimed
+_STRIPE_SLOT_POLL = 0.05  # seconds between acquisition attempts
+
+_ACQUIRE_SLOT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return 1
+"""
+_acquire_slot_script = None
+
+
+@asynccontextmanager
+async def stripe_concurrency_limiter():
+    """Hold one of the fleet-wide Stripe slots for the duration of a call."""
+    global _acquire_slot_script
+    try:
+        client = RedisManager.get_client()
+    except RuntimeError:
+        # No Redis in this context (scripts, tests) — fall back to the
+        # in-process limits alone
+        yield
+        return
+
+    if _acquire_slot_script is None:
+        _acquire_slot_script = client.register_script(_ACQUIRE_SLOT_LUA)
+
+    slot_id = uuid4().bytes[:4].hex()
+    while True:
+        now = time.time()
+        acquired = await _acquire_slot_script(
+            keys=[_STRIPE_SLOT_KEY],
+            args=[
+                now - _STRIPE_SLOT_WINDOW,
+                _STRIPE_GLOBAL_CONCURRENCY,
+                now,
+                slot_id,
+                _STRIPE_SLOT_WINDOW,
+            ],
+        )
+        if acquired:
+            break
+        await asyncio.sleep(_STRIPE_SLOT_POLL)
+
+    try:
+        yield
+    finally:
+        await client.zrem(_STRIPE_SLOT_KEY, slot_id)
+
+
+async def stripe_call(func, *args, **kwargs):
+    """Run an async Stripe call with pacing, bounded concurrency and retries.
+
+    Each attempt first takes a token from the client-side bucket so bursts
+    never reach Stripe's limiter; rate-limit and connection errors are then
+    retried with capped exponential backoff plus jitter. Other Stripe
+    errors propagate to the caller unchanged.
+    """
+    async with _stripe_semaphore:
+        for attempt in range(_STRIPE_MAX_ATTEMPTS):
+            await _stripe_bucket.acquire()
+            try:
+                # Slot is taken per attempt so backoff sleeps don't pin a
+                # fleet-wide slot
+                async with stripe_concurrency_limiter():
+                    return await func(*args, **kwargs)
+            except (stripe.error.RateLimitError, stripe.error.APIConnectionError):
+                if attempt == _STRIPE_MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(min(2 ** attempt + random.random(), _STRIPE_MAX_BACKOFF))
 
 
 
@@ -23,7 +166,7 @@ async def create_payment_intent(
     :param currency: defaults to USD
     :return:
     """
-    intent: dict = await asyncify(stripe.PaymentIntent.create)(
+    intent: dict = await stripe.PaymentIntent.create_async(
         amount=amount,
         currency=currency,
     )
@@ -55,8 +198,9 @@ async def create_stripe_checkout_session(
 ) -> Session:
     ui_mode = 'embedded'
     mode = 'payment'
-    return_url = settings.STRIPE_RETURN_URL + '?session_id={CHECKOUT_SESSION_ID}'
-    session = await asyncify(stripe.checkout.Session.create)(
+    return_url = settings.stripe.STRIPE_RETURN_URL + '?session_id={CHECKOUT_SESSION_ID}'
+    session = await stripe_call(
+        stripe.checkout.Session.create_async,
         ui_mode=ui_mode,
         line_items=items,
         mode=mode,
@@ -74,8 +218,8 @@ async def create_stripe_checkout_session(
 
 async def cancel_payment_intent(payment_intent_id: str):
     try:
-        intent = stripe.PaymentIntent.retrieve(payment_intent_id)
-        stripe.Refund.create(payment_intent=intent)
+        intent = await stripe.PaymentIntent.retrieve_async(payment_intent_id)
+        await stripe.Refund.create_async(payment_intent=intent)
         return "succeeded"
     except stripe.error.StripeError as e:
         logging.exception(f"Stripe error: {e}")
@@ -0,0 +1,11 @@
+from uvicorn.workers import UvicornWorker
+
+
+class FootyUvicornWorker(UvicornWorker):
+    """Uvicorn worker pinned to uvloop + httptools.
+
+    The defaults resolve to "auto", which silently falls back to the
+    selector loop and h11 if the fast implementations are missing; pinning
+    them makes a misbuilt image fail loudly instead of running slow.
+    """
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}